@@ -1,4 +1,4 @@
 """Configuration package"""
-from .config import TradingConfig, PairTradingConfig, ZerodhaFeeStructure
+from .config import TradingConfig, PairTradingConfig, ZerodhaFeeStructure, FEES
 
-__all__ = ['TradingConfig', 'PairTradingConfig', 'ZerodhaFeeStructure']
+__all__ = ['TradingConfig', 'PairTradingConfig', 'ZerodhaFeeStructure', 'FEES']
@@ -1,67 +1,92 @@
 # Configuration file for Statistical Arbitrage Bot
 # Zerodha fee structure and trading parameters
 
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
 class ZerodhaFeeStructure:
     """
     Zerodha fee structure as per 2025 rates
     All charges are in percentage unless specified
+
+    Frozen so fee rates cannot be mutated at runtime; derived totals are
+    precomputed once in __post_init__ so hot fee loops read a single slot
+    instead of re-adding component rates per trade.
     """
 
     # Brokerage charges
-    DELIVERY_BROKERAGE = 0.0  # Free for delivery
-    INTRADAY_BROKERAGE_PERCENT = 0.0003  # 0.03%
-    INTRADAY_BROKERAGE_MAX = 20.0  # Max Rs 20 per order
+    DELIVERY_BROKERAGE: float = 0.0  # Free for delivery
+    INTRADAY_BROKERAGE_PERCENT: float = 0.0003  # 0.03%
+    INTRADAY_BROKERAGE_MAX: float = 20.0  # Max Rs 20 per order
 
     # STT (Securities Transaction Tax) rates
-    STT_DELIVERY_BUY = 0.001  # 0.1% on buy side
-    STT_DELIVERY_SELL = 0.001  # 0.1% on sell side
-    STT_INTRADAY_SELL = 0.00025  # 0.025% on sell side only
+    STT_DELIVERY_BUY: float = 0.001  # 0.1% on buy side
+    STT_DELIVERY_SELL: float = 0.001  # 0.1% on sell side
+    STT_INTRADAY_SELL: float = 0.00025  # 0.025% on sell side only
 
     # Exchange transaction charges (per crore)
-    NSE_TRANSACTION_CHARGES = 297.0 / 10000000  # Rs 297 per crore
-    BSE_TRANSACTION_CHARGES = 375.0 / 10000000  # Rs 375 per crore
+    NSE_TRANSACTION_CHARGES: float = 297.0 / 10000000  # Rs 297 per crore
+    BSE_TRANSACTION_CHARGES: float = 375.0 / 10000000  # Rs 375 per crore
 
     # SEBI charges
-    SEBI_CHARGES = 10.0 / 10000000  # Rs 10 per crore
+    SEBI_CHARGES: float = 10.0 / 10000000  # Rs 10 per crore
 
     # Stamp duty (per crore, on buy side only)
-    STAMP_DUTY_DELIVERY = 1500.0 / 10000000  # Rs 1500 per crore
-    STAMP_DUTY_INTRADAY = 300.0 / 10000000   # Rs 300 per crore
+    STAMP_DUTY_DELIVERY: float = 1500.0 / 10000000  # Rs 1500 per crore
+    STAMP_DUTY_INTRADAY: float = 300.0 / 10000000   # Rs 300 per crore
 
     # GST on brokerage and transaction charges
-    GST_RATE = 0.18  # 18%
+    GST_RATE: float = 0.18  # 18%
 
     # DP charges (when selling from demat)
-    DP_CHARGES = 13.5  # Rs 13.5 per scrip
-
+    DP_CHARGES: float = 13.5  # Rs 13.5 per scrip
+
+    # Derived totals, computed once at construction
+    STT_DELIVERY_TOTAL: float = field(init=False)
+    NSE_PLUS_SEBI: float = field(init=False)
+    BSE_PLUS_SEBI: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'STT_DELIVERY_TOTAL',
+                           self.STT_DELIVERY_BUY + self.STT_DELIVERY_SELL)
+        object.__setattr__(self, 'NSE_PLUS_SEBI',
+                           self.NSE_TRANSACTION_CHARGES + self.SEBI_CHARGES)
+        object.__setattr__(self, 'BSE_PLUS_SEBI',
+                           self.BSE_TRANSACTION_CHARGES + self.SEBI_CHARGES)
+
+@dataclass(slots=True)
 class TradingConfig:
-    """Trading strategy configuration"""
+    """Trading strategy configuration
+
+    Slotted (but not frozen) because the dashboard settings tab updates
+    thresholds at runtime.
+    """
 
     # Risk management
-    MAX_POSITION_SIZE = 0.02  # 2% of portfolio per position
-    STOP_LOSS_MULTIPLIER = 2.5  # Stop loss at 2.5 standard deviations
-    TAKE_PROFIT_MULTIPLIER = 1.0  # Take profit at 1 standard deviation
+    MAX_POSITION_SIZE: float = 0.02  # 2% of portfolio per position
+    STOP_LOSS_MULTIPLIER: float = 2.5  # Stop loss at 2.5 standard deviations
+    TAKE_PROFIT_MULTIPLIER: float = 1.0  # Take profit at 1 standard deviation
 
     # Entry/Exit thresholds for z-score
-    Z_SCORE_ENTRY = 2.0
-    Z_SCORE_EXIT = 0.5
+    Z_SCORE_ENTRY: float = 2.0
+    Z_SCORE_EXIT: float = 0.5
 
     # Lookback periods
-    LOOKBACK_PERIOD = 60  # Days for cointegration test
-    ROLLING_WINDOW = 20   # Days for rolling statistics
+    LOOKBACK_PERIOD: int = 60  # Days for cointegration test
+    ROLLING_WINDOW: int = 20   # Days for rolling statistics
 
     # Minimum profit threshold (after all costs)
-    MIN_PROFIT_THRESHOLD = 0.001  # 0.1% minimum profit required
+    MIN_PROFIT_THRESHOLD: float = 0.001  # 0.1% minimum profit required
 
     # Data refresh intervals
-    DATA_REFRESH_MINUTES = 5
-    PRICE_UPDATE_SECONDS = 30
-
-class PairTradingConfig:
-    """Pairs trading specific configuration"""
+    DATA_REFRESH_MINUTES: int = 5
+    PRICE_UPDATE_SECONDS: int = 30
 
-    # Stock pairs for analysis
-    DEFAULT_PAIRS = [
+# Stock pairs for analysis (raw, possibly with duplicates/orderings)
+_PAIRS_RAW = (
         ('HDFCBANK.NS', 'ICICIBANK.NS'),
         ('KOTAKBANK.NS', 'AXISBANK.NS'),
         ('HDFCBANK.NS', 'KOTAKBANK.NS'),
@@ -102,18 +127,93 @@ class PairTradingConfig:
         ('POWERGRID.NS', 'NTPC.NS'),
         ('TATAPOWER.NS', 'ADANIPOWER.NS'),
         ('JSW.NS', 'TORNTPOWER.NS'),
-        
-    ]
+    )
+
+# Canonical pair universe: each pair stored as a sorted tuple, deduplicated
+# once at import time. PAIRS_SET gives O(1) membership tests.
+DEFAULT_PAIRS = tuple(sorted({tuple(sorted(p)) for p in _PAIRS_RAW}))
+PAIRS_SET = frozenset(DEFAULT_PAIRS)
+
+# Ticker universe and integer index arrays for vectorized pair scanning.
+# A (T, n_tickers) price matrix can be gathered column-wise as
+# prices[:, PAIRS_IDX[:, 0]] / prices[:, PAIRS_IDX[:, 1]] instead of
+# doing per-pair dict lookups in the cointegration-scan inner loop.
+TICKERS = tuple(sorted({t for pair in DEFAULT_PAIRS for t in pair}))
+_TICKER_INDEX = {ticker: i for i, ticker in enumerate(TICKERS)}
+PAIRS_IDX = np.asarray(
+    [(_TICKER_INDEX[a], _TICKER_INDEX[b]) for a, b in DEFAULT_PAIRS],
+    dtype=np.int32,
+)
+
+# Sector membership for the pair universe. Screening can restrict the
+# scan to intra-sector candidates instead of walking the whole list.
+_SECTOR_TICKERS = {
+    'BANKING': ('HDFCBANK.NS', 'ICICIBANK.NS', 'KOTAKBANK.NS', 'AXISBANK.NS',
+                'INDUSINDBK.NS', 'FEDERALBNK.NS', 'BANDHANBNK.NS', 'RBLBANK.NS',
+                'YESBANK.NS', 'IDFCFIRSTB.NS', 'SBIN.NS', 'PNB.NS',
+                'BANKBARODA.NS', 'CANFINHOME.NS', 'UNIONBANK.NS', 'INDIANB.NS'),
+    'IT': ('TCS.NS', 'INFY.NS', 'WIPRO.NS', 'HCLTECH.NS', 'TECHM.NS', 'LTI.NS',
+           'MINDTREE.NS', 'MPHASIS.NS', 'COFORGE.NS', 'PERSISTENT.NS'),
+    'PHARMA': ('SUNPHARMA.NS', 'DRREDDY.NS', 'CIPLA.NS', 'LUPIN.NS',
+               'AUROPHARMA.NS', 'GLENMARK.NS', 'BIOCON.NS', 'CADILAHC.NS',
+               'TORNTPHARM.NS', 'ALKEM.NS'),
+    'FMCG': ('HINDUNILVR.NS', 'ITC.NS', 'NESTLEIND.NS', 'BRITANNIA.NS',
+             'DABUR.NS', 'MARICO.NS', 'COLPAL.NS', 'GODREJCP.NS',
+             'TATACONSUM.NS', 'UBL.NS'),
+    'AUTO': ('MARUTI.NS', 'HYUNDAI.NS', 'M&M.NS', 'TVSMOTOR.NS',
+             'HEROMOTOCO.NS', 'BAJAJ-AUTO.NS', 'EICHERMOT.NS', 'BOSCHLTD.NS',
+             'MOTHERSUMI.NS', 'BALKRISIND.NS', 'MRF.NS'),
+    'ENERGY': ('RELIANCE.NS', 'ONGC.NS', 'IOC.NS', 'BPCL.NS', 'HINDPETRO.NS',
+               'GAIL.NS', 'PETRONET.NS', 'IGL.NS'),
+    'POWER': ('POWERGRID.NS', 'NTPC.NS', 'TATAPOWER.NS', 'ADANIPOWER.NS',
+              'JSW.NS', 'TORNTPOWER.NS'),
+}
+TICKER_SECTOR = {t: sector for sector, tickers in _SECTOR_TICKERS.items()
+                 for t in tickers}
+PAIRS_BY_SECTOR = {}
+for _pair in DEFAULT_PAIRS:
+    _sector = TICKER_SECTOR.get(_pair[0])
+    if _sector is not None and _sector == TICKER_SECTOR.get(_pair[1]):
+        PAIRS_BY_SECTOR.setdefault(_sector, []).append(_pair)
+PAIRS_BY_SECTOR = {sector: tuple(pairs)
+                   for sector, pairs in PAIRS_BY_SECTOR.items()}
+
+@lru_cache(maxsize=None)
+def candidate_pairs(sectors=None):
+    """Return the candidate pair set, optionally restricted to the given
+    sectors (a sector name or tuple of names). Results are cached so
+    repeated screening passes reuse the same tuple."""
+    if sectors is None:
+        return DEFAULT_PAIRS
+    if isinstance(sectors, str):
+        sectors = (sectors,)
+    return tuple(pair for sector in sectors
+                 for pair in PAIRS_BY_SECTOR.get(sector, ()))
+
+@dataclass(frozen=True, slots=True)
+class PairTradingConfig:
+    """Pairs trading specific configuration"""
 
-    # Correlation threshold
-    MIN_CORRELATION = 0.1
+    # Stock pairs for analysis (canonicalized at module import)
+    DEFAULT_PAIRS: tuple = DEFAULT_PAIRS
+
+    # Correlation prefilter: pairs below this |corr| are rejected
+    # before the (much more expensive) cointegration test
+    MIN_CORRELATION: float = 0.5
 
     # Cointegration p-value threshold
-    MAX_COINTEGRATION_PVALUE = 0.05
+    MAX_COINTEGRATION_PVALUE: float = 0.05
+
+    # Fixed ADF lag for coint(); skips the per-pair BIC/AIC lag search
+    COINT_MAXLAG: int = 4
 
     # Portfolio allocation
-    MAX_PAIRS_ACTIVE = 3
-    CAPITAL_PER_PAIR = 100000  # Rs 1 lakh per pair
+    MAX_PAIRS_ACTIVE: int = 3
+    CAPITAL_PER_PAIR: int = 100000  # Rs 1 lakh per pair
+
+# Shared singleton; consumers should prefer this over constructing
+# ZerodhaFeeStructure themselves so derived totals are computed once.
+FEES = ZerodhaFeeStructure()
 
 # API Configuration (for future Kite integration)
 class APIConfig:
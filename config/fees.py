@@ -0,0 +1,21 @@
+"""Flat fee constants generated from config.ZerodhaFeeStructure.
+
+Generated by setup.py (build_py); do not edit by hand.
+"""
+
+DELIVERY_BROKERAGE = 0.0
+INTRADAY_BROKERAGE_PERCENT = 0.0003
+INTRADAY_BROKERAGE_MAX = 20.0
+STT_DELIVERY_BUY = 0.001
+STT_DELIVERY_SELL = 0.001
+STT_INTRADAY_SELL = 0.00025
+NSE_TRANSACTION_CHARGES = 2.97e-05
+BSE_TRANSACTION_CHARGES = 3.75e-05
+SEBI_CHARGES = 1e-06
+STAMP_DUTY_DELIVERY = 0.00015
+STAMP_DUTY_INTRADAY = 3e-05
+GST_RATE = 0.18
+DP_CHARGES = 13.5
+STT_DELIVERY_TOTAL = 0.002
+NSE_PLUS_SEBI = 3.07e-05
+BSE_PLUS_SEBI = 3.8499999999999994e-05
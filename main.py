@@ -6,14 +6,14 @@ Main application entry point
 
 import sys
 import os
-from tkinter import *
-import tkinter
-from tkinter import messagebox
+import functools
+import importlib.util
 import logging
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+@functools.lru_cache(maxsize=None)
 def check_dependencies():
     """Check if all required dependencies are installed"""
     required_packages = [
@@ -21,13 +21,12 @@ def check_dependencies():
         'seaborn', 'scipy', 'statsmodels', 'sklearn'
     ]
 
-    missing_packages = []
-
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only probes the import machinery instead of executing each
+    # package, so the sweep costs milliseconds rather than full imports.
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
 
     if missing_packages:
         error_msg = f"""
@@ -49,22 +48,36 @@ def setup_directories():
     directories = ['logs', 'data']
 
     for directory in directories:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Created directory: {directory}")
+        # Single syscall path; exist_ok avoids the exists()+makedirs() race
+        os.makedirs(directory, exist_ok=True)
 
+@functools.lru_cache(maxsize=None)
 def setup_logging():
-    """Setup application logging"""
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    """Setup application logging
+
+    Cached so repeated calls return the configured logger without
+    re-running basicConfig or stacking duplicate handlers.
+    """
+    from logging.handlers import RotatingFileHandler
+    from config.config import LoggingConfig
 
     # Create logs directory if it doesn't exist
     os.makedirs('logs', exist_ok=True)
 
+    # delay=True defers opening the log file until the first record is
+    # emitted; rotation keeps the file bounded per LoggingConfig.
+    file_handler = RotatingFileHandler(
+        LoggingConfig.LOG_FILE,
+        maxBytes=LoggingConfig.MAX_LOG_SIZE_MB * 1024 * 1024,
+        backupCount=LoggingConfig.BACKUP_COUNT,
+        delay=True
+    )
+
     logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
+        level=getattr(logging, LoggingConfig.LOG_LEVEL),
+        format=LoggingConfig.LOG_FORMAT,
         handlers=[
-            logging.FileHandler('logs/stat_arb.log'),
+            file_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -87,6 +100,12 @@ def main():
     setup_directories()
     logger = setup_logging()
 
+    # Tk (and the dashboard stack it pulls in) is only imported once the
+    # dependency check has passed, keeping startup failures readable and
+    # the interpreter light until the GUI is actually needed.
+    import tkinter
+    from tkinter import messagebox
+
     try:
         # Import dashboard after dependency check
         from dashboard import StatisticalArbitrageDashboard
@@ -1,42 +1,111 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import feedparser
 import webbrowser
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
 import sqlite3
 import csv
+import hashlib
+import heapq
+import os
+import re
 import requests
+from lxml import etree
 from PIL import Image
 import pymupdf as fitz  # PyMuPDF
 from plyer import notification  # pip install plyer
 
-# Configuration
-FEEDS = {
+# Configuration (read-only: the proxy/tuples reject accidental mutation
+# and let every consumer trust these bindings as constants)
+FEEDS = MappingProxyType({
     "Announcements": ("https://nsearchives.nseindia.com/content/RSS/Online_announcements.xml", 300),
     "Annual Reports": ("https://nsearchives.nseindia.com/content/RSS/Annual_Reports.xml", 600),
     "Board Meetings": ("https://nsearchives.nseindia.com/content/RSS/Board_Meetings.xml", 300),
     "Sustainability": ("https://nsearchives.nseindia.com/content/RSS/brsr.xml", 600),
-}
+})
 USER_AGENT = "Mozilla/5.0"
 DB_FILE = "rss_items.db"
-ALERT_KEYWORDS = ["dividend", "meeting", "sustainability"]
+ALERT_KEYWORDS = ("dividend", "meeting", "sustainability")
+# All keywords matched in one pass over each title by the compiled
+# multi-pattern automaton, instead of a lowercase + substring test per
+# keyword per entry.
+_ALERT_RE = re.compile("|".join(map(re.escape, ALERT_KEYWORDS)), re.IGNORECASE)
+PDF_CACHE_DIR = "pdf_cache"
+PDF_CACHE_MAX = 64  # most-recently-used PDFs kept on disk
+
+def _extract_pdf_text(content):
+    """Render first-page text from PDF bytes. Module-level so it can run
+    in a worker process, keeping PyMuPDF's CPU-heavy parsing off the GIL
+    and away from the UI."""
+    doc = fitz.open(stream=content, filetype="pdf")
+    page = doc.load_page(0)
+    txt = page.get_text("text")
+    return txt[:500].replace("\n", " ") + "…"
+
+def _parse_feed(source):
+    """Parse an RSS document (file-like or bytes) into entry dicts.
+
+    Streams through lxml's C parser instead of feedparser's pure-Python
+    sanitizer; the NSE feeds are plain RSS 2.0 so only item/link/title/
+    description/pubDate are needed.
+    """
+    root = etree.parse(source).getroot()
+    entries = []
+    for item in root.iter("item"):
+        entry = {}
+        for tag, key in (("link", "link"), ("title", "title"),
+                         ("description", "summary"), ("pubDate", "published")):
+            el = item.find(tag)
+            entry[key] = el.text.strip() if el is not None and el.text else ""
+        entries.append(entry)
+    return entries
 
 class RSSApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Indian Stock Market RSS Visualizer")
         self.geometry("1000x700")
+        self._db_local = threading.local()
+        self._http = requests.Session()
+        self._http.headers["User-Agent"] = USER_AGENT
+        self._pdf_pool = None
+        # Bounded pool shared by all feed fetches; "Refresh All" queues
+        # work here instead of spawning one daemon thread per feed.
+        self._fetch_pool = ThreadPoolExecutor(max_workers=4,
+                                              thread_name_prefix="feed")
         self._init_db()
         self.entries = []
+        self._entries_key = None
         self._create_widgets()
         self._load_entries()
-        for feed, (_, interval) in FEEDS.items():
-            self._schedule_refresh(feed, interval)
+        now = time.monotonic()
+        self._refresh_heap = [(now + interval, feed)
+                              for feed, (_, interval) in FEEDS.items()]
+        heapq.heapify(self._refresh_heap)
+        self._run_scheduler()
+
+    def _db(self):
+        """Return this thread's cached SQLite connection, creating it on
+        first use. Connections are not shareable across threads, so each
+        worker keeps its own instead of opening/closing per operation."""
+        conn = getattr(self._db_local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(DB_FILE)
+            # synchronous is per-connection: the fetch workers doing the
+            # batched INSERT commits need it too, not just the UI thread
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_local.conn = conn
+        return conn
 
     def _init_db(self):
-        conn = sqlite3.connect(DB_FILE)
+        conn = self._db()
         c = conn.cursor()
+        # WAL lets the UI thread read while a refresh thread writes and
+        # persists in the database file; NORMAL sync (safe with WAL,
+        # avoids an fsync per commit) is per-connection and set in _db().
+        c.execute("PRAGMA journal_mode=WAL")
         c.execute("""
             CREATE TABLE IF NOT EXISTS items (
                 link TEXT PRIMARY KEY,
@@ -48,7 +117,6 @@ class RSSApp(tk.Tk):
             )
         """)
         conn.commit()
-        conn.close()
 
     def _create_widgets(self):
         toolbar = ttk.Frame(self)
@@ -93,81 +161,157 @@ class RSSApp(tk.Tk):
         for feed in FEEDS:
             self._fetch_feed(feed)
 
-    def _schedule_refresh(self, feed, interval):
-        self.after(interval * 1000, lambda f=feed: [self._fetch_feed(f), self._schedule_refresh(f, interval)])
+    def _run_scheduler(self):
+        """Single after() job driving all feed refreshes off a min-heap of
+        next-due times, instead of one recursive lambda chain per feed."""
+        now = time.monotonic()
+        while self._refresh_heap and self._refresh_heap[0][0] <= now:
+            _, feed = heapq.heappop(self._refresh_heap)
+            self._fetch_feed(feed)
+            heapq.heappush(self._refresh_heap, (now + FEEDS[feed][1], feed))
+        delay_ms = max(100, int((self._refresh_heap[0][0] - now) * 1000))
+        self.after(delay_ms, self._run_scheduler)
 
     def _fetch_feed(self, feed):
         def worker():
             self.status.config(text=f"Refreshing {feed}...")
             url, _ = FEEDS[feed]
-            data = feedparser.parse(url, request_headers={"User-Agent": USER_AGENT})
-            conn = sqlite3.connect(DB_FILE)
+            try:
+                resp = self._http.get(url, timeout=15, stream=True)
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                entries = _parse_feed(resp.raw)
+            except Exception as e:
+                # Bind the message now: the except variable is deleted
+                # when the block exits, before the lambda runs
+                msg = f"{feed} refresh failed: {e}"
+                self.after(0, lambda: self.status.config(text=msg))
+                return
+            rows = [(entry.get("link",""), feed, entry.get("title",""),
+                     entry.get("summary",""), entry.get("published",""), 0)
+                    for entry in entries]
+            conn = self._db()
             c = conn.cursor()
-            for entry in data.entries:
-                link = entry.get("link","")
-                title = entry.get("title","")
-                summary = entry.get("summary","")
-                published = entry.get("published","")
-                try:
-                    c.execute("INSERT INTO items VALUES (?,?,?,?,?,0)",
-                              (link, feed, title, summary, published))
-                    for kw in ALERT_KEYWORDS:
-                        if kw.lower() in title.lower():
-                            notification.notify(title=f"{feed} alert", message=title, timeout=5)
-                            break
-                except sqlite3.IntegrityError:
-                    pass
+            c.execute("SELECT link FROM items WHERE source=?", (feed,))
+            known = {r[0] for r in c.fetchall()}
+            new_rows = [r for r in rows if r[0] not in known]
+            # One transaction (one fsync) for the whole batch instead of
+            # an INSERT + IntegrityError round-trip per entry.
+            c.executemany("INSERT OR IGNORE INTO items VALUES (?,?,?,?,?,?)", new_rows)
             conn.commit()
-            conn.close()
+            alert = _ALERT_RE.search
+            for _, _, title, _, _, _ in new_rows:
+                if alert(title):
+                    notification.notify(title=f"{feed} alert", message=title, timeout=5)
             self.after(0, lambda: [self._load_entries(), self.status.config(text=f"{feed} refreshed")])
-        threading.Thread(target=worker, daemon=True).start()
+        self._fetch_pool.submit(worker)
 
     def _load_entries(self):
-        conn = sqlite3.connect(DB_FILE)
+        conn = self._db()
         c = conn.cursor()
+        # data_version bumps when another connection commits; total_changes
+        # covers writes on this connection. If neither moved since the last
+        # load, the cached entries are still valid and the full re-query +
+        # tree repopulate can be skipped.
+        data_version = c.execute("PRAGMA data_version").fetchone()[0]
+        key = (data_version, conn.total_changes)
+        if key == self._entries_key:
+            return
+        self._entries_key = key
         c.execute("SELECT source,title,published,read,summary,link FROM items ORDER BY published DESC")
-        rows = c.fetchall()
-        conn.close()
-        self.entries = [
+        self.entries = self._rows_to_entries(c.fetchall())
+        self.entries_by_link = {e["link"]: e for e in self.entries}
+        self._populate_trees(self.entries)
+
+    @staticmethod
+    def _rows_to_entries(rows):
+        return [
             {"source":r[0],"title":r[1],"published":r[2],
              "read":bool(r[3]),"summary":r[4],"link":r[5]}
             for r in rows
         ]
-        self._populate_trees(self.entries)
 
     def _populate_trees(self, entries):
+        # Diff against what each tree already shows instead of wiping and
+        # reinserting every row. Rows are keyed by link so iids stay stable
+        # across refreshes; set_children() enforces the final ordering.
+        desired = {feed: [] for feed in self.trees}
+        for e in entries:
+            desired[e["source"]].append(
+                (e["link"], (e["title"], e["published"],
+                             "Yes" if e["read"] else "No")))
         for feed, tree in self.trees.items():
-            for iid in tree.get_children():
+            current = set(tree.get_children())
+            wanted = desired[feed]
+            wanted_ids = {iid for iid, _ in wanted}
+            for iid in current - wanted_ids:
                 tree.delete(iid)
-        for idx, e in enumerate(entries):
-            self.trees[e["source"]].insert("", tk.END, iid=idx,
-                                           values=(e["title"], e["published"],
-                                                   "Yes" if e["read"] else "No"))
+            for iid, values in wanted:
+                if iid in current:
+                    if tuple(tree.item(iid, "values")) != values:
+                        tree.item(iid, values=values)
+                else:
+                    tree.insert("", tk.END, iid=iid, values=values)
+            tree.set_children("", *(iid for iid, _ in wanted))
 
     def _apply_search(self):
-        term = self.search_var.get().lower()
-        filtered = [e for e in self.entries if term in e["title"].lower() or term in e["summary"].lower()]
-        self._populate_trees(filtered)
+        # Filtering happens in SQLite (LIKE is case-insensitive for ASCII)
+        # rather than lowercasing every title/summary in Python.
+        term = self.search_var.get()
+        pattern = f"%{term}%"
+        c = self._db().cursor()
+        c.execute("SELECT source,title,published,read,summary,link FROM items "
+                  "WHERE title LIKE ? OR summary LIKE ? ORDER BY published DESC",
+                  (pattern, pattern))
+        self._populate_trees(self._rows_to_entries(c.fetchall()))
         self.status.config(text=f"Filtered by '{term}'")
 
     def _on_select(self, event):
         tree = event.widget
         sel = tree.focus()
         if not sel: return
-        entry = self.entries[int(sel)]
+        entry = self.entries_by_link.get(sel)
+        if entry is None: return
         threading.Thread(target=self._load_preview, args=(entry,), daemon=True).start()
 
+    def _fetch_pdf(self, url):
+        """Fetch a PDF through the shared session, backed by a small
+        least-recently-used cache on disk so reselecting an item doesn't
+        re-download it."""
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        path = os.path.join(PDF_CACHE_DIR,
+                            hashlib.sha1(url.encode()).hexdigest() + ".pdf")
+        if os.path.exists(path):
+            os.utime(path)  # bump recency
+            with open(path, "rb") as f:
+                return f.read()
+        resp = self._http.get(url, timeout=10)
+        resp.raise_for_status()
+        with open(path, "wb") as f:
+            f.write(resp.content)
+        self._prune_pdf_cache()
+        return resp.content
+
+    def _prune_pdf_cache(self):
+        files = [os.path.join(PDF_CACHE_DIR, n) for n in os.listdir(PDF_CACHE_DIR)]
+        if len(files) <= PDF_CACHE_MAX:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - PDF_CACHE_MAX]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     def _load_preview(self, entry):
         text = entry["summary"]
         url = entry["link"]
         if url.lower().endswith(".pdf"):
             try:
-                resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=10)
-                resp.raise_for_status()
-                doc = fitz.open(stream=resp.content, filetype="pdf")
-                page = doc.load_page(0)
-                txt = page.get_text("text")
-                text = txt[:500].replace("\n"," ") + "…"
+                content = self._fetch_pdf(url)
+                if self._pdf_pool is None:
+                    self._pdf_pool = ProcessPoolExecutor(max_workers=1)
+                text = self._pdf_pool.submit(_extract_pdf_text, content).result()
             except Exception as e:
                 text = f"[PDF preview error]\n{e}"
         self.after(0, lambda: self._update_preview(text, url))
@@ -177,19 +321,15 @@ class RSSApp(tk.Tk):
         self.preview.delete(1.0, tk.END)
         self.preview.insert(tk.END, text)
         self.preview.config(state=tk.DISABLED)
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute("UPDATE items SET read=1 WHERE link=?", (url,))
+        conn = self._db()
+        conn.execute("UPDATE items SET read=1 WHERE link=?", (url,))
         conn.commit()
-        conn.close()
         self._load_entries()
 
     def _mark_all_read(self):
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute("UPDATE items SET read=1")
+        conn = self._db()
+        conn.execute("UPDATE items SET read=1")
         conn.commit()
-        conn.close()
         self._load_entries()
         self.status.config(text="All marked read")
 
@@ -205,6 +345,12 @@ class RSSApp(tk.Tk):
         messagebox.showinfo("Export", f"Exported to {path}")
 
     def on_closing(self):
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False)
+        conn = getattr(self._db_local, "conn", None)
+        if conn is not None:
+            conn.close()
         self.destroy()
 
 if __name__ == "__main__":
@@ -2,12 +2,62 @@
 Setup script for Statistical Arbitrage Trading System
 """
 
+import dataclasses
+import os
+import sys
+from pathlib import Path
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+FEES_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "config", "fees.py")
+
+def generate_fees_module():
+    """Write config/fees.py as flat module-level constants.
+
+    Hot fee code can read these as plain module globals (a single dict
+    lookup at function-call time, no instance attribute indirection).
+    The file is committed, and regenerated here whenever the package is
+    built so it can never drift from ZerodhaFeeStructure.
+    """
+    # PEP 517 front-ends exec setup.py without the source tree on
+    # sys.path, so add it before importing the config package
+    pkg_root = os.path.dirname(os.path.abspath(__file__))
+    if pkg_root not in sys.path:
+        sys.path.insert(0, pkg_root)
+    from config.config import FEES
+
+    lines = [
+        '"""Flat fee constants generated from config.ZerodhaFeeStructure.',
+        "",
+        "Generated by setup.py (build_py); do not edit by hand.",
+        '"""',
+        "",
+    ]
+    for f in dataclasses.fields(FEES):
+        lines.append(f"{f.name} = {getattr(FEES, f.name)!r}")
+    lines.append("")
+    with open(FEES_MODULE, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines))
+
+class BuildPyWithFees(build_py):
+    """build_py that refreshes the generated fee-constant module first."""
+
+    def run(self):
+        generate_fees_module()
+        super().run()
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+# The README only matters for distribution metadata; skip reading it for
+# everyday commands like develop/install/build_py.
+_DIST_COMMANDS = {"sdist", "bdist", "bdist_wheel", "upload", "check"}
+if _DIST_COMMANDS.intersection(sys.argv[1:]):
+    long_description = Path(__file__).with_name("README.md").read_text(encoding="utf-8")
+else:
+    long_description = ""
 
 setup(
+    cmdclass={"build_py": BuildPyWithFees},
     name="statistical-arbitrage-system",
     version="1.0.0",
     author="Statistical Arbitrage Developer",
@@ -33,6 +83,7 @@ setup(
     install_requires=[
         "pandas>=1.5.0",
         "numpy>=1.21.0",
+        "bottleneck>=1.3.0",
         "yfinance>=0.2.0",
         "matplotlib>=3.5.0",
         "seaborn>=0.11.0",
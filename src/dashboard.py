@@ -11,11 +11,14 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
+import functools
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 import os
+import pickle
 import queue
 import json
 
@@ -24,7 +27,60 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from config.config import TradingConfig, PairTradingConfig
 from src.stat_arb_engine import StatisticalArbitrageEngine
-from src.fee_calculator import ZerodhaFeeCalculator
+from src.fee_calculator import IntradayFeeCalculator
+
+# Screening results survive restarts here; analyze_pair output contains
+# pandas timestamps, so pickle rather than JSON.
+PAIRS_CACHE_FILE = os.path.join('data', 'pairs_cache.pkl')
+PAIRS_CACHE_MAX_AGE = 24 * 3600  # seconds
+SETTINGS_FILE = os.path.join('data', 'settings.json')
+
+_CLOCK_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Parsed once at import; rendered with format_map over the flattened
+# fee result instead of rebuilding a 15-interpolation f-string per call
+_FEE_TEMPLATE = """Fee Calculation Results
+{sep}
+Trade Details:
+  Quantity: {quantity} shares
+  Buy Price: ₹{buy_price}
+  Sell Price: ₹{sell_price}
+  Buy Value: ₹{buy_value:,.2f}
+  Sell Value: ₹{sell_value:,.2f}
+
+Charges Breakdown:
+  Brokerage: ₹{brokerage}
+  STT: ₹{stt}
+  Transaction Charges: ₹{transaction_charges}
+  SEBI Charges: ₹{sebi_charges}
+  Stamp Duty: ₹{stamp_duty}
+  GST: ₹{gst}
+
+Summary:
+  Total Charges: ₹{total_charges}
+  Gross Profit: ₹{gross_profit}
+  Net Profit: ₹{net_profit}
+  Net Profit %: {net_profit_percent}%
+"""
+
+_hms_cache = (None, '')
+
+@functools.lru_cache(maxsize=None)
+def _pretty_label(key):
+    """Turn a snake_case key into a display label, computed once per key."""
+    return key.replace('_', ' ').title()
+
+def _now_hms():
+    """Wall-clock HH:MM:SS, formatted at most once per second.
+
+    Monitoring ticks and log batches stamp many rows with the same
+    second; caching avoids a strftime call per row.
+    """
+    global _hms_cache
+    second = int(time.time())
+    if second != _hms_cache[0]:
+        _hms_cache = (second, datetime.now().strftime("%H:%M:%S"))
+    return _hms_cache[1]
 
 class StatisticalArbitrageDashboard:
     """Main dashboard application"""
@@ -37,16 +93,28 @@ class StatisticalArbitrageDashboard:
 
         # Initialize components
         self.engine = StatisticalArbitrageEngine()
-        self.fee_calculator = ZerodhaFeeCalculator()
+        # The dashboard trades intraday, so fold the trade type into
+        # the calculator's dispatch at construction
+        self.fee_calculator = IntradayFeeCalculator()
         self.trading_config = TradingConfig()
         self.pair_config = PairTradingConfig()
 
         # Data storage
         self.viable_pairs = []
+        self.pairs_by_name = {}
         self.selected_pair_data = None
+        self.pair_canvas = None
+        self._chart_title = None
+        self._chart_background = None
         self.log_queue = queue.Queue()
         self.is_monitoring = False
-        self.monitoring_thread = None
+        self._toast_after = None
+        self._last_status = ""
+
+        # Shared pool for callbacks that compute off the Tk thread;
+        # results come back via root.after polling so all widget
+        # updates stay on the main thread.
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='calc')
 
         # Setup GUI
         self.setup_gui()
@@ -55,6 +123,35 @@ class StatisticalArbitrageDashboard:
         # Start with pair screening
         self.update_status("Ready - Click 'Screen Pairs' to begin analysis")
 
+        # Restore the last screening session if it's still fresh
+        self._load_pairs_cache()
+
+    def _load_pairs_cache(self):
+        """Restore the previous screening result from disk if recent"""
+        try:
+            if time.time() - os.path.getmtime(PAIRS_CACHE_FILE) > PAIRS_CACHE_MAX_AGE:
+                return
+            with open(PAIRS_CACHE_FILE, 'rb') as f:
+                self.viable_pairs = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return
+
+        if self.viable_pairs:
+            self.update_pairs_display()
+            self.update_status(
+                f"Restored {len(self.viable_pairs)} pairs from last session")
+
+    def _save_pairs_cache(self):
+        """Persist the current screening result for the next app start"""
+        try:
+            os.makedirs('data', exist_ok=True)
+            tmp = PAIRS_CACHE_FILE + '.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(self.viable_pairs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, PAIRS_CACHE_FILE)
+        except OSError:
+            pass
+
     def setup_gui(self):
         """Setup the main GUI components"""
         # Create main notebook for tabs
@@ -74,8 +171,10 @@ class StatisticalArbitrageDashboard:
         self.status_label = Label(self.status_frame, text="Initializing...", anchor=W)
         self.status_label.pack(side=LEFT, padx=5)
 
-        # Real-time clock
-        self.clock_label = Label(self.status_frame, text="", anchor=E)
+        # Real-time clock; a textvariable so ticks go through
+        # StringVar.set instead of the heavier configure path
+        self.clock_var = StringVar()
+        self.clock_label = Label(self.status_frame, textvariable=self.clock_var, anchor=E)
         self.clock_label.pack(side=RIGHT, padx=5)
         self.update_clock()
 
@@ -88,31 +187,34 @@ class StatisticalArbitrageDashboard:
         metrics_frame = ttk.LabelFrame(self.overview_frame, text="Key Metrics", padding=10)
         metrics_frame.pack(fill=X, padx=10, pady=5)
 
-        # Create metrics display
-        self.metrics_vars = {
-            'total_pairs': StringVar(value="0"),
-            'active_pairs': StringVar(value="0"),
-            'total_signals': StringVar(value="0"),
-            'profit_loss': StringVar(value="₹0.00"),
-            'win_rate': StringVar(value="0%"),
-            'last_update': StringVar(value="Never")
+        # Create metrics display; plain labels updated via configure, so
+        # there's no StringVar/Tcl-variable tracing layer in between.
+        metrics = {
+            'total_pairs': "0",
+            'active_pairs': "0",
+            'total_signals': "0",
+            'profit_loss': "₹0.00",
+            'win_rate': "0%",
+            'last_update': "Never"
         }
+        self.metrics_labels = {}
 
         # Metrics grid
         metrics_grid = ttk.Frame(metrics_frame)
         metrics_grid.pack(fill=X)
 
         row = 0
-        for i, (key, var) in enumerate(self.metrics_vars.items()):
+        for i, (key, value) in enumerate(metrics.items()):
             col = i % 3
             if col == 0 and i > 0:
                 row += 1
 
-            label_text = key.replace('_', ' ').title()
+            label_text = _pretty_label(key)
             ttk.Label(metrics_grid, text=f"{label_text}:", font=('Arial', 10, 'bold')).grid(
                 row=row*2, column=col, sticky='w', padx=10, pady=2)
-            ttk.Label(metrics_grid, textvariable=var, font=('Arial', 12)).grid(
-                row=row*2+1, column=col, sticky='w', padx=10, pady=2)
+            value_label = ttk.Label(metrics_grid, text=value, font=('Arial', 12))
+            value_label.grid(row=row*2+1, column=col, sticky='w', padx=10, pady=2)
+            self.metrics_labels[key] = value_label
 
         # Control buttons
         control_frame = ttk.LabelFrame(self.overview_frame, text="Controls", padding=10)
@@ -194,7 +296,7 @@ class StatisticalArbitrageDashboard:
         }
 
         for i, (key, var) in enumerate(self.pair_info_vars.items()):
-            label_text = key.replace('_', ' ').title()
+            label_text = _pretty_label(key)
             ttk.Label(info_frame, text=f"{label_text}:", font=('Arial', 9, 'bold')).grid(
                 row=i, column=0, sticky='w', pady=2)
             ttk.Label(info_frame, textvariable=var, font=('Arial', 9)).grid(
@@ -340,7 +442,7 @@ class StatisticalArbitrageDashboard:
 
         row = 0
         for key, var in self.settings_vars.items():
-            label_text = key.replace('_', ' ').title()
+            label_text = _pretty_label(key)
             ttk.Label(params_frame, text=f"{label_text}:").grid(row=row, column=0, sticky='w', pady=5)
 
             entry = ttk.Entry(params_frame, textvariable=var, width=10)
@@ -370,7 +472,7 @@ class StatisticalArbitrageDashboard:
 
         col = 0
         for key, var in self.fee_vars.items():
-            ttk.Label(calc_frame, text=f"{key.replace('_', ' ').title()}:").grid(
+            ttk.Label(calc_frame, text=f"{_pretty_label(key)}:").grid(
                 row=0, column=col, padx=5)
             ttk.Entry(calc_frame, textvariable=var, width=10).grid(
                 row=1, column=col, padx=5)
@@ -395,25 +497,46 @@ class StatisticalArbitrageDashboard:
 
     def setup_logging(self):
         """Setup logging display"""
-        self.update_log_display()
+        # Woken by a virtual event whenever a message is queued, instead
+        # of polling the queue every second.
+        self.root.bind('<<LogMessage>>', self.update_log_display)
+
+    def log_message(self, message):
+        """Queue a message for the log display and wake the UI.
+
+        Safe to call from worker threads: the queue is thread-safe and
+        event_generate hands off to the Tk event loop.
+        """
+        self.log_queue.put(message)
+        try:
+            self.root.event_generate('<<LogMessage>>', when='tail')
+        except TclError:
+            pass  # window being torn down
 
-    def update_log_display(self):
+    def update_log_display(self, event=None):
         """Update log display with recent messages"""
+        # Drain a bounded chunk per wakeup (so a burst can't starve the
+        # event loop) and push it to the widget as one insert.
+        messages = []
         try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_display.insert(END, f"{datetime.now().strftime('%H:%M:%S')} - {message}\n")
-                self.log_display.see(END)
+            for _ in range(100):
+                messages.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
 
-        # Schedule next update
-        self.root.after(1000, self.update_log_display)
+        if messages:
+            stamp = _now_hms()
+            self.log_display.insert(END, ''.join(f"{stamp} - {m}\n" for m in messages))
+            self._trim_text_widget(self.log_display)
+            self.log_display.see(END)
+
+        if not self.log_queue.empty():
+            self.root.after_idle(self.update_log_display)
 
     def screen_pairs_threaded(self):
         """Screen pairs in a separate thread"""
         if hasattr(self, 'screening_thread') and self.screening_thread.is_alive():
-            messagebox.showinfo("Info", "Pair screening already in progress...")
+            self._show_toast("Pair screening already in progress...")
             return
 
         self.screen_button.configure(state='disabled', text="Screening...")
@@ -425,7 +548,10 @@ class StatisticalArbitrageDashboard:
     def screen_pairs_worker(self):
         """Worker function for pair screening"""
         try:
+            # The engine batches the universe download and fans the
+            # per-pair cointegration math out over a process pool
             self.viable_pairs = self.engine.screen_all_pairs()
+            self._save_pairs_cache()
 
             # Update GUI in main thread
             self.root.after(0, self.update_pairs_display)
@@ -441,29 +567,50 @@ class StatisticalArbitrageDashboard:
 
     def update_pairs_display(self):
         """Update pairs treeview with results"""
-        # Clear existing items
-        for item in self.pairs_tree.get_children():
-            self.pairs_tree.delete(item)
-
-        # Add viable pairs
-        for pair_data in self.viable_pairs:
-            p_value = pair_data['cointegration_details']['p_value']
-            correlation = pair_data['correlation']
-            z_score = pair_data['current_z_score']
-            signal = pair_data['current_signal']['signal']
-
-            self.pairs_tree.insert('', 'end', values=(
+        # Diff against the rows already shown (keyed by pair name) so a
+        # monitoring refresh only touches changed rows instead of
+        # repainting the whole table. All formatting happens up front in
+        # one batch; Tk is only called for rows that actually changed,
+        # and ordering is applied with a single set_children call.
+        self.pairs_by_name = {p['pair']: p for p in self.viable_pairs}
+        tree = self.pairs_tree
+        rows = [
+            (pair_data['pair'], (
                 pair_data['pair'],
-                f"{p_value:.4f}",
-                f"{correlation:.3f}",
-                f"{z_score:.2f}",
-                signal,
-                "Active"
-            ))
+                f"{pair_data['cointegration_details']['p_value']:.4f}",
+                f"{pair_data['correlation']:.3f}",
+                f"{pair_data['current_z_score']:.2f}",
+                pair_data['current_signal']['signal'],
+                "Active"))
+            for pair_data in self.viable_pairs
+        ]
+
+        current = set(tree.get_children())
+        wanted = {iid for iid, _ in rows}
+        for iid in current - wanted:
+            tree.delete(iid)
+        for iid, values in rows:
+            if iid in current:
+                # Write only the cells that changed (usually just Z-Score
+                # and Signal on a monitoring tick) rather than replacing
+                # the whole row tuple.
+                old = tree.item(iid, 'values')
+                for col, old_val, new_val in zip(tree['columns'], old, values):
+                    if str(old_val) != new_val:
+                        tree.set(iid, col, new_val)
+            else:
+                tree.insert('', 'end', iid=iid, values=values)
+        tree.set_children('', *(iid for iid, _ in rows))
 
         # Update metrics
-        self.metrics_vars['total_pairs'].set(str(len(self.viable_pairs)))
-        self.metrics_vars['last_update'].set(datetime.now().strftime("%H:%M:%S"))
+        self.set_metric('total_pairs', str(len(self.viable_pairs)))
+        self.set_metric('last_update', _now_hms())
+
+    def set_metric(self, key, value):
+        """Update one overview metric label, skipping no-op redraws"""
+        label = self.metrics_labels[key]
+        if label.cget('text') != value:
+            label.configure(text=value)
 
     def on_pair_select(self, event):
         """Handle pair selection in treeview"""
@@ -474,12 +621,7 @@ class StatisticalArbitrageDashboard:
         item = self.pairs_tree.item(selection[0])
         pair_name = item['values'][0]
 
-        # Find selected pair data
-        self.selected_pair_data = None
-        for pair in self.viable_pairs:
-            if pair['pair'] == pair_name:
-                self.selected_pair_data = pair
-                break
+        self.selected_pair_data = self.pairs_by_name.get(pair_name)
 
         if self.selected_pair_data:
             self.update_pair_details()
@@ -505,37 +647,74 @@ class StatisticalArbitrageDashboard:
         # Update chart (placeholder for now)
         self.plot_pair_chart()
 
+    def _init_pair_chart(self):
+        """Create the pair chart once: static artists (thresholds, grid,
+        legend) live in the cached background, the spread line is marked
+        animated so it can be blitted on top per update."""
+        self.pair_fig = Figure(figsize=(8, 4), dpi=100)
+        ax = self.pair_fig.add_subplot(111)
+        self.pair_ax = ax
+
+        entry = self.trading_config.Z_SCORE_ENTRY
+        ax.axhline(y=entry, color='r', linestyle='--', alpha=0.7, label='Entry Threshold')
+        ax.axhline(y=-entry, color='r', linestyle='--', alpha=0.7)
+        ax.axhline(y=0, color='g', linestyle='-', alpha=0.5, label='Mean')
+        (self.pair_line,) = ax.plot([], [], 'b-', alpha=0.7, label='Spread',
+                                    animated=True)
+
+        ax.set_xlim(0, 49)
+        ax.set_ylim(-3, 3)
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Z-Score')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+        self.pair_canvas = FigureCanvasTkAgg(self.pair_fig, self.pair_chart_frame)
+        self.pair_canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        # Any full render (title change, resize) invalidates the cached
+        # background; re-grab it and repaint the line when one completes.
+        self.pair_canvas.mpl_connect('draw_event', self._on_chart_draw)
+
+    def _on_chart_draw(self, event):
+        self._chart_background = self.pair_canvas.copy_from_bbox(self.pair_ax.bbox)
+        self.pair_ax.draw_artist(self.pair_line)
+        self.pair_canvas.blit(self.pair_ax.bbox)
+
     def plot_pair_chart(self):
         """Plot pair analysis chart"""
-        # Clear existing chart
-        for widget in self.pair_chart_frame.winfo_children():
-            widget.destroy()
-
         if not self.selected_pair_data:
             return
 
-        # Create matplotlib figure
-        fig = Figure(figsize=(8, 4), dpi=100)
-        ax = fig.add_subplot(111)
+        if self.pair_canvas is None:
+            self._init_pair_chart()
 
         # Plot placeholder data (you can extend this with real spread data)
-        x = range(50)
-        y = [np.sin(i/10) + np.random.normal(0, 0.1) for i in x]
-        ax.plot(x, y, 'b-', alpha=0.7, label='Spread')
-        ax.axhline(y=2, color='r', linestyle='--', alpha=0.7, label='Entry Threshold')
-        ax.axhline(y=-2, color='r', linestyle='--', alpha=0.7)
-        ax.axhline(y=0, color='g', linestyle='-', alpha=0.5, label='Mean')
-
-        ax.set_title(f"Spread Analysis - {self.selected_pair_data['pair']}")
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Z-Score')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
+        x = np.arange(50)
+        y = np.sin(x / 10) + np.random.normal(0, 0.1, x.size)
+        self.pair_line.set_data(x, y)
+
+        # Widen the view if the series escapes the cached background;
+        # that invalidates the blit cache and forces one full render.
+        lo, hi = self.pair_ax.get_ylim()
+        if y.min() < lo or y.max() > hi:
+            self.pair_ax.set_ylim(min(lo, y.min() - 0.5), max(hi, y.max() + 0.5))
+            self._chart_background = None
+
+        title = f"Spread Analysis - {self.selected_pair_data['pair']}"
+        if title != self._chart_title or self._chart_background is None:
+            # Title is part of the static background: queue one coalesced
+            # full render; _on_chart_draw re-caches the background and
+            # paints the line once it completes.
+            self._chart_title = title
+            self.pair_ax.set_title(title)
+            self.pair_canvas.draw_idle()
+            return
 
-        # Embed chart in tkinter
-        canvas = FigureCanvasTkAgg(fig, self.pair_chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        # Blit just the spread line over the cached background instead of
+        # re-rendering the whole figure.
+        self.pair_canvas.restore_region(self._chart_background)
+        self.pair_ax.draw_artist(self.pair_line)
+        self.pair_canvas.blit(self.pair_ax.bbox)
 
     def toggle_monitoring(self):
         """Toggle real-time monitoring"""
@@ -554,10 +733,9 @@ class StatisticalArbitrageDashboard:
         self.monitor_button.configure(text="Stop Monitoring", style='Warning.TButton')
         self.update_status("Real-time monitoring started...")
 
-        # Start monitoring thread
-        self.monitoring_thread = threading.Thread(target=self.monitoring_worker)
-        self.monitoring_thread.daemon = True
-        self.monitoring_thread.start()
+        # First tick runs immediately; subsequent ticks are rescheduled
+        # via root.after once each pass finishes.
+        self.root.after(0, self._monitoring_tick)
 
     def stop_monitoring(self):
         """Stop real-time monitoring"""
@@ -565,49 +743,95 @@ class StatisticalArbitrageDashboard:
         self.monitor_button.configure(text="Start Monitoring", style='TButton')
         self.update_status("Monitoring stopped")
 
-    def monitoring_worker(self):
-        """Worker function for real-time monitoring"""
-        while self.is_monitoring:
-            try:
-                # Update data for all viable pairs
-                for i, pair in enumerate(self.viable_pairs):
-                    if not self.is_monitoring:
-                        break
+    def _monitoring_tick(self):
+        """Kick off one monitoring pass in a worker thread.
+
+        Scheduling lives on the Tk event loop (root.after) instead of a
+        sleeping thread; only the engine calls run off-thread, and their
+        results are applied back on the Tk thread.
+        """
+        if not self.is_monitoring:
+            return
+        threading.Thread(target=self._monitoring_pass, daemon=True).start()
 
-                    # Re-analyze pair with fresh data
-                    updated_analysis = self.engine.analyze_pair(
-                        pair['symbol1'], pair['symbol2'], period='5d')
+    def _monitoring_pass(self):
+        """Re-analyze all viable pairs off the Tk thread, then apply the
+        results and schedule the next tick."""
+        delay_ms = self.trading_config.DATA_REFRESH_MINUTES * 60 * 1000
+        try:
+            # Snapshot once: the Tk thread rebinds self.viable_pairs when a
+            # pass completes, so iterate a local alias with the symbol
+            # columns pulled out up front instead of re-reading the
+            # attribute and dicts inside the loop.
+            pairs = self.viable_pairs
+            symbols = [(p['symbol1'], p['symbol2']) for p in pairs]
 
-                    if updated_analysis.get('cointegrated'):
-                        self.viable_pairs[i] = updated_analysis
+            updated = []
+            for (symbol1, symbol2), pair in zip(symbols, pairs):
+                if not self.is_monitoring:
+                    return
 
-                # Update GUI
-                self.root.after(0, self.update_pairs_display)
-                self.root.after(0, self.check_for_signals)
+                # Re-analyze pair with fresh data
+                updated_analysis = self.engine.analyze_pair(
+                    symbol1, symbol2, period='5d')
 
-                # Wait before next update
-                time.sleep(self.trading_config.DATA_REFRESH_MINUTES * 60)
+                updated.append(updated_analysis
+                               if updated_analysis.get('cointegrated') else pair)
 
-            except Exception as e:
-                self.log_queue.put(f"Monitoring error: {str(e)}")
-                time.sleep(60)  # Wait longer on error
+            # Detect signals here on the worker; only widget updates are
+            # handed back to the Tk thread.
+            new_signals = self._detect_signals(updated)
+
+            def apply(updated=updated, new_signals=new_signals):
+                self.viable_pairs = updated
+                self.update_pairs_display()
+                self._display_signals(new_signals)
+
+            self.root.after(0, apply)
+
+        except Exception as e:
+            self.log_message(f"Monitoring error: {str(e)}")
+            delay_ms = 60 * 1000  # Wait longer on error
+
+        if self.is_monitoring:
+            self.root.after(delay_ms, self._monitoring_tick)
+
+    @staticmethod
+    def _detect_signals(pairs):
+        """Scan pairs for actionable entry signals.
+
+        Pure computation over a snapshot of the pairs list (no widget
+        access), so it can run on the monitoring worker thread. The
+        strength/entry filter is evaluated as one NumPy mask instead of
+        per-pair Python comparisons.
+        """
+        if not pairs:
+            return []
+
+        n = len(pairs)
+        strengths = np.fromiter((p['current_signal']['strength'] for p in pairs),
+                                dtype=np.float64, count=n)
+        is_entry = np.fromiter(
+            (p['current_signal']['signal'] in ('LONG_PAIR', 'SHORT_PAIR')
+             for p in pairs),
+            dtype=bool, count=n)
+
+        stamp = _now_hms()
+        return [{
+            'time': stamp,
+            'pair': pairs[i]['pair'],
+            'signal': pairs[i]['current_signal']['signal'],
+            'z_score': f"{pairs[i]['current_z_score']:.2f}",
+            'action': pairs[i]['current_signal']['action'],
+            'confidence': f"{pairs[i]['current_signal']['strength']:.1f}"
+        } for i in np.nonzero(is_entry & (strengths >= 1.5))[0]]
 
     def check_for_signals(self):
         """Check for new trading signals"""
-        new_signals = []
-
-        for pair in self.viable_pairs:
-            signal = pair['current_signal']
-            if signal['signal'] in ['LONG_PAIR', 'SHORT_PAIR'] and signal['strength'] >= 1.5:
-                new_signals.append({
-                    'time': datetime.now().strftime("%H:%M:%S"),
-                    'pair': pair['pair'],
-                    'signal': signal['signal'],
-                    'z_score': f"{pair['current_z_score']:.2f}",
-                    'action': signal['action'],
-                    'confidence': f"{signal['strength']:.1f}"
-                })
+        self._display_signals(self._detect_signals(self.viable_pairs))
 
+    def _display_signals(self, new_signals):
+        """Push detected signals into the signals tree and log (Tk thread)"""
         # Update signals tree
         if new_signals:
             # Clear old signals (keep last 20)
@@ -625,10 +849,22 @@ class StatisticalArbitrageDashboard:
 
             # Log new signals
             for signal in new_signals:
-                self.signal_log.insert(END, 
+                self.signal_log.insert(END,
                     f"[{signal['time']}] {signal['pair']}: {signal['signal']} "
                     f"(Z={signal['z_score']}, Conf={signal['confidence']})\n")
-                self.signal_log.see(END)
+            self._trim_text_widget(self.signal_log)
+            self.signal_log.see(END)
+
+    @staticmethod
+    def _trim_text_widget(widget, max_lines=500):
+        """Drop the oldest lines once a Text widget exceeds max_lines.
+
+        Tk Text operations slow down as the buffer grows, so long-running
+        sessions keep these widgets bounded with a rolling delete.
+        """
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            widget.delete('1.0', f'{line_count - max_lines + 1}.0')
 
     def execute_signal(self):
         """Execute selected trading signal (placeholder)"""
@@ -653,11 +889,11 @@ class StatisticalArbitrageDashboard:
 
         # Add to positions tree (paper trade)
         self.positions_tree.insert('', 'end', values=(
-            pair_name, signal_type, datetime.now().strftime("%H:%M:%S"),
+            pair_name, signal_type, _now_hms(),
             "Market Price", "₹0.00", "Paper Trade", "Close"
         ))
 
-        messagebox.showinfo("Success", f"Paper trade executed for {pair_name}")
+        self._show_toast(f"Paper trade executed for {pair_name}")
 
     def calculate_position(self):
         """Calculate position sizes for selected signal"""
@@ -669,12 +905,7 @@ class StatisticalArbitrageDashboard:
         item = self.signals_tree.item(selection[0])
         pair_name = item['values'][1]
 
-        # Find pair data
-        pair_data = None
-        for pair in self.viable_pairs:
-            if pair['pair'] == pair_name:
-                pair_data = pair
-                break
+        pair_data = self.pairs_by_name.get(pair_name)
 
         if pair_data:
             # Show position calculation dialog
@@ -736,22 +967,37 @@ Max Position Size: {self.trading_config.MAX_POSITION_SIZE*100:.1f}%
             ('11:45:18', 'TCS.NS-INFY.NS', 'LONG', '50+55', '₹4,150.00', '₹52.10', '+₹425.80', 'Open'),
         ]
 
+        insert = self.history_tree.insert
         for trade in sample_trades:
-            self.history_tree.insert('', 'end', values=trade)
+            insert('', 'end', values=trade)
 
     def refresh_data(self):
         """Refresh all data"""
         self.update_status("Refreshing data...")
         # Implement data refresh logic
-        messagebox.showinfo("Info", "Data refresh functionality would update all pair data.")
+        self._show_toast("Data refresh functionality would update all pair data.")
 
     def refresh_trade_history(self):
         """Refresh trade history"""
-        # Clear and reload
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        # Clear in one Tcl call rather than one delete per row
+        children = self.history_tree.get_children()
+        if children:
+            self.history_tree.delete(*children)
         self.load_sample_trade_data()
-        messagebox.showinfo("Success", "Trade history refreshed")
+        self._show_toast("Trade history refreshed")
+
+    def _run_in_background(self, fn, on_done):
+        """Run fn on the shared executor and hand the finished future
+        to on_done back on the Tk thread"""
+        future = self.executor.submit(fn)
+
+        def poll():
+            if future.done():
+                on_done(future)
+            else:
+                self.root.after(50, poll)
+
+        self.root.after(50, poll)
 
     def export_data(self):
         """Export current data to CSV"""
@@ -759,45 +1005,107 @@ Max Position Size: {self.trading_config.MAX_POSITION_SIZE*100:.1f}%
             messagebox.showwarning("Warning", "No data to export. Please screen pairs first.")
             return
 
-        try:
-            # Create DataFrame and export
-            export_data = []
-            for pair in self.viable_pairs:
-                export_data.append({
-                    'Pair': pair['pair'],
-                    'P_Value': pair['cointegration_details']['p_value'],
-                    'Hedge_Ratio': pair['cointegration_details']['hedge_ratio'],
-                    'Correlation': pair['correlation'],
-                    'Current_Z_Score': pair['current_z_score'],
-                    'Signal': pair['current_signal']['signal'],
-                    'Signal_Strength': pair['current_signal']['strength']
-                })
-
-            df = pd.DataFrame(export_data)
-            filename = f"pairs_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(filename, index=False)
-
-            messagebox.showinfo("Success", f"Data exported to {filename}")
+        # Snapshot on the Tk thread; the frame build and file write run
+        # on the shared executor so large exports don't freeze the GUI
+        viable_pairs = self.viable_pairs
+        self._run_in_background(lambda: self._write_pairs_csv(viable_pairs),
+                                self._on_export_done)
 
+    def _on_export_done(self, future):
+        """Report the finished export back on the Tk thread"""
+        try:
+            filename = future.result()
+            self._show_toast(f"Data exported to {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
 
+    @staticmethod
+    def _write_pairs_csv(viable_pairs):
+        """Build the export frame column-by-column and write the CSV"""
+        # Build the frame column-by-column (no per-row dicts, no
+        # dtype inference) and write through the pyarrow CSV engine
+        n = len(viable_pairs)
+        pairs = [''] * n
+        p_values = np.empty(n)
+        hedge_ratios = np.empty(n)
+        correlations = np.empty(n)
+        z_scores = np.empty(n)
+        signals = [''] * n
+        strengths = np.empty(n)
+
+        for i, pair in enumerate(viable_pairs):
+            coint = pair['cointegration_details']
+            signal = pair['current_signal']
+            pairs[i] = pair['pair']
+            p_values[i] = coint['p_value']
+            hedge_ratios[i] = coint['hedge_ratio']
+            correlations[i] = pair['correlation']
+            z_scores[i] = pair['current_z_score']
+            signals[i] = signal['signal']
+            strengths[i] = signal['strength']
+
+        df = pd.DataFrame({
+            'Pair': pairs,
+            'P_Value': p_values,
+            'Hedge_Ratio': hedge_ratios,
+            'Correlation': correlations,
+            'Current_Z_Score': z_scores,
+            'Signal': signals,
+            'Signal_Strength': strengths
+        })
+        filename = f"pairs_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            pa_csv.write_csv(pa.Table.from_pandas(df), filename)
+        except ImportError:
+            df.to_csv(filename, index=False)
+
+        return filename
+
     def export_trades(self):
         """Export trade history"""
-        messagebox.showinfo("Info", "Trade export functionality would save trade history to CSV.")
+        self._show_toast("Trade export functionality would save trade history to CSV.")
 
     def save_settings(self):
         """Save current settings"""
         try:
-            # Update config values (in production, would save to file)
-            self.trading_config.Z_SCORE_ENTRY = self.settings_vars['z_score_entry'].get()
-            self.trading_config.Z_SCORE_EXIT = self.settings_vars['z_score_exit'].get()
-            # ... update other settings
+            settings = {key: var.get() for key, var in self.settings_vars.items()}
+
+            # Update config values
+            self.trading_config.Z_SCORE_ENTRY = settings['z_score_entry']
+            self.trading_config.Z_SCORE_EXIT = settings['z_score_exit']
+            self.trading_config.STOP_LOSS_MULTIPLIER = settings['stop_loss_multiplier']
+            self.trading_config.MIN_PROFIT_THRESHOLD = settings['min_profit_threshold'] / 100
+            self.trading_config.MAX_POSITION_SIZE = settings['max_position_size'] / 100
+            self.trading_config.ROLLING_WINDOW = settings['rolling_window']
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
+            return
 
-            messagebox.showinfo("Success", "Settings saved successfully!")
+        # Persist off the Tk thread so a slow fsync can't stall the GUI
+        self._run_in_background(lambda: self._write_settings(settings),
+                                self._on_settings_saved)
+
+    def _on_settings_saved(self, future):
+        """Report the finished settings write back on the Tk thread"""
+        try:
+            future.result()
+            self._show_toast("Settings saved successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
 
+    @staticmethod
+    def _write_settings(settings, filename=SETTINGS_FILE):
+        """Atomically persist the settings dict as compact JSON"""
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        tmp = filename + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(json.dumps(settings, separators=(',', ':')))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+
     def reset_settings(self):
         """Reset settings to defaults"""
         self.settings_vars['z_score_entry'].set(2.0)
@@ -807,7 +1115,7 @@ Max Position Size: {self.trading_config.MAX_POSITION_SIZE*100:.1f}%
         self.settings_vars['max_position_size'].set(2.0)
         self.settings_vars['rolling_window'].set(20)
 
-        messagebox.showinfo("Success", "Settings reset to defaults")
+        self._show_toast("Settings reset to defaults")
 
     def calculate_fees(self):
         """Calculate and display trading fees"""
@@ -815,69 +1123,101 @@ Max Position Size: {self.trading_config.MAX_POSITION_SIZE*100:.1f}%
             quantity = self.fee_vars['quantity'].get()
             buy_price = self.fee_vars['buy_price'].get()
             sell_price = self.fee_vars['sell_price'].get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Fee calculation failed: {str(e)}")
+            return
 
-            result = self.fee_calculator.calculate_total_charges(
-                quantity, buy_price, sell_price, "intraday", "NSE"
-            )
+        # Compute off the Tk thread; the display update happens in the
+        # poll callback once the future resolves.
+        future = self.executor.submit(
+            self.fee_calculator.compute_charges,
+            quantity, buy_price, sell_price, "intraday", "NSE"
+        )
+        self.root.after(50, self._poll_fee_result, future)
+
+    def _poll_fee_result(self, future):
+        """Check the pending fee future and display it when ready"""
+        if not future.done():
+            self.root.after(50, self._poll_fee_result, future)
+            return
+
+        try:
+            result = future.result()
 
             # Display results
             self.fee_result_text.delete(1.0, END)
 
-            output = f"""Fee Calculation Results
-{'='*40}
-Trade Details:
-  Quantity: {result['trade_details']['quantity']} shares
-  Buy Price: ₹{result['trade_details']['buy_price']}
-  Sell Price: ₹{result['trade_details']['sell_price']}
-  Buy Value: ₹{result['trade_details']['buy_value']:,.2f}
-  Sell Value: ₹{result['trade_details']['sell_value']:,.2f}
-
-Charges Breakdown:
-  Brokerage: ₹{result['breakdown']['brokerage']}
-  STT: ₹{result['breakdown']['stt']}
-  Transaction Charges: ₹{result['breakdown']['transaction_charges']}
-  SEBI Charges: ₹{result['breakdown']['sebi_charges']}
-  Stamp Duty: ₹{result['breakdown']['stamp_duty']}
-  GST: ₹{result['breakdown']['gst']}
-
-Summary:
-  Total Charges: ₹{result['totals']['total_charges']}
-  Gross Profit: ₹{result['totals']['gross_profit']}
-  Net Profit: ₹{result['totals']['net_profit']}
-  Net Profit %: {result['totals']['net_profit_percent']}%
-"""
-
-            self.fee_result_text.insert(1.0, output)
+            flat = result._asdict()
+            flat['sep'] = '=' * 40
+            self.fee_result_text.insert(1.0, _FEE_TEMPLATE.format_map(flat))
 
         except Exception as e:
             messagebox.showerror("Error", f"Fee calculation failed: {str(e)}")
 
     def update_status(self, message):
         """Update status bar message"""
-        self.status_label.configure(text=message)
-        self.log_queue.put(message)
+        self._last_status = message
+        if self._toast_after is None:
+            self.status_label.configure(text=message)
+        self.log_message(message)
+
+    def _show_toast(self, message, duration_ms=2500):
+        """Show short-lived feedback in the status bar
+
+        Non-modal replacement for success dialogs: a modal messagebox
+        blocks the whole event loop until dismissed.
+        """
+        if self._toast_after is not None:
+            self.root.after_cancel(self._toast_after)
+        self.status_label.configure(text=message, foreground='#006400')
+        self.log_message(message)
+        self._toast_after = self.root.after(duration_ms, self._clear_toast)
+
+    def _clear_toast(self):
+        """Restore the regular status text after a toast expires"""
+        self._toast_after = None
+        self.status_label.configure(text=self._last_status, foreground='black')
 
     def update_clock(self):
         """Update real-time clock"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.clock_label.configure(text=current_time)
-        self.root.after(1000, self.update_clock)
+        now = time.time()
+        self.clock_var.set(time.strftime(_CLOCK_FORMAT, time.localtime(int(now))))
+        # Wake exactly at the next second boundary rather than drifting
+        # on a fixed 1000 ms period.
+        self.root.after(int((1.0 - now % 1.0) * 1000) + 1, self.update_clock)
 
-def main():
-    """Main function to run the application"""
-    root = tkinter.Tk()
+_style = None
+
+def _configure_styles():
+    """Configure the ttk theme and custom styles exactly once
+
+    Returns the cached Style singleton so later callers never re-run
+    theme_use/configure/map, which re-parse the Tcl style maps.
+    """
+    global _style
+    if _style is not None:
+        return _style
 
-    # Configure style
     style = ttk.Style()
     style.theme_use('clam')  # Use a modern theme
 
-    # Configure custom styles
+    # Custom styles; state maps are built once from concrete tuples so
+    # hovers don't re-evaluate freshly constructed Tcl lists
     style.configure('Accent.TButton', foreground='white')
     style.map('Accent.TButton', background=[('active', '#0078d4')])
 
     style.configure('Warning.TButton', foreground='white')
     style.map('Warning.TButton', background=[('active', '#d83b01')])
 
+    _style = style
+    return style
+
+def main():
+    """Main function to run the application"""
+    root = tkinter.Tk()
+
+    _configure_styles()
+
     # Create and run application
     app = StatisticalArbitrageDashboard(root)
 
@@ -3,17 +3,124 @@ Fee Calculator for Zerodha trading charges
 Implements all fees, taxes, and charges as per Zerodha 2025 structure
 """
 
+import functools
+import math
+from collections import namedtuple
 import sys
 import os
+
+import numpy as np
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
 
-from config import ZerodhaFeeStructure
+from config import FEES
+# Flat constants generated by setup.py (build_py): plain module globals,
+# so the hot per-leg math below pays one LOAD_GLOBAL per rate instead of
+# a dataclass attribute lookup
+from config.fees import (BSE_TRANSACTION_CHARGES, INTRADAY_BROKERAGE_MAX,
+                         INTRADAY_BROKERAGE_PERCENT, NSE_TRANSACTION_CHARGES,
+                         SEBI_CHARGES, STAMP_DUTY_DELIVERY,
+                         STAMP_DUTY_INTRADAY, STT_DELIVERY_BUY)
+
+@functools.lru_cache(maxsize=4096)
+def _buy_side_fees(quantity: int, buy_price: float, trade_type: str,
+                   exchange: str) -> tuple:
+    """
+    Sell-independent charge components, memoized per trade leg
+
+    Profitability checks and break-even searches vary only the sell
+    price, so the buy side recurs with identical inputs many times;
+    caching returns the same 5-tuple without redoing the math.
+
+    Returns:
+        (brokerage, stt, transaction_charges, sebi_charges, stamp_duty)
+    """
+    turnover = quantity * buy_price
+    if exchange.upper() == "NSE":
+        txn_rate = NSE_TRANSACTION_CHARGES
+    else:
+        txn_rate = BSE_TRANSACTION_CHARGES
+
+    if trade_type.lower() == "delivery":
+        brokerage = 0.0
+        stt = turnover * STT_DELIVERY_BUY
+        stamp_duty = turnover * STAMP_DUTY_DELIVERY
+    else:
+        brokerage = min(turnover * INTRADAY_BROKERAGE_PERCENT,
+                        INTRADAY_BROKERAGE_MAX)
+        stt = 0.0
+        stamp_duty = turnover * STAMP_DUTY_INTRADAY
+
+    return (brokerage, stt, turnover * txn_rate,
+            turnover * SEBI_CHARGES, stamp_duty)
+
+# Flat result record for one round-trip trade: fixed schema, single
+# tuple allocation, attribute access instead of nested dict lookups
+FeeResult = namedtuple('FeeResult', [
+    'brokerage', 'stt', 'transaction_charges', 'sebi_charges',
+    'stamp_duty', 'gst', 'dp_charges', 'total_charges', 'gross_profit',
+    'net_profit', 'net_profit_percent', 'quantity', 'buy_price',
+    'sell_price', 'buy_value', 'sell_value', 'trade_type', 'exchange'])
+
+# All per-rupee rates for one (trade_type, exchange) combination;
+# looked up once per call so the fee math itself is branch-free
+RateBundle = namedtuple('RateBundle', ['brokerage_rate', 'brokerage_max',
+                                       'stt_buy', 'stt_sell', 'txn',
+                                       'sebi', 'stamp'])
+
+def _build_rate_table() -> dict:
+    """Precompute RateBundles for the four trade_type/exchange combos"""
+    table = {}
+    for exchange, txn_rate in (("NSE", FEES.NSE_TRANSACTION_CHARGES),
+                               ("BSE", FEES.BSE_TRANSACTION_CHARGES)):
+        table[("intraday", exchange)] = RateBundle(
+            FEES.INTRADAY_BROKERAGE_PERCENT, FEES.INTRADAY_BROKERAGE_MAX,
+            0.0, FEES.STT_INTRADAY_SELL, txn_rate, FEES.SEBI_CHARGES,
+            FEES.STAMP_DUTY_INTRADAY)
+        table[("delivery", exchange)] = RateBundle(
+            0.0, 0.0, FEES.STT_DELIVERY_BUY, FEES.STT_DELIVERY_SELL,
+            txn_rate, FEES.SEBI_CHARGES, FEES.STAMP_DUTY_DELIVERY)
+    return table
+
+@functools.lru_cache(maxsize=None)
+def _aggregate_rates(trade_type: str, exchange: str) -> tuple:
+    """
+    Per-rupee charge totals for each trade leg with GST folded in
+
+    Everything except the capped intraday brokerage collapses into one
+    rate per leg, so a total needs two turnover multiplies instead of
+    ten.
+
+    Returns:
+        (buy_rate, sell_rate, brokerage_rate)
+    """
+    gst = 1.0 + FEES.GST_RATE
+    if exchange.upper() == "NSE":
+        txn_rate = FEES.NSE_TRANSACTION_CHARGES
+    else:
+        txn_rate = FEES.BSE_TRANSACTION_CHARGES
+
+    if trade_type.lower() == "delivery":
+        buy_rate = (FEES.STT_DELIVERY_BUY + txn_rate * gst +
+                    FEES.SEBI_CHARGES + FEES.STAMP_DUTY_DELIVERY)
+        sell_rate = FEES.STT_DELIVERY_SELL + txn_rate * gst + FEES.SEBI_CHARGES
+        brokerage_rate = 0.0
+    else:
+        buy_rate = txn_rate * gst + FEES.SEBI_CHARGES + FEES.STAMP_DUTY_INTRADAY
+        sell_rate = FEES.STT_INTRADAY_SELL + txn_rate * gst + FEES.SEBI_CHARGES
+        brokerage_rate = FEES.INTRADAY_BROKERAGE_PERCENT
+
+    return buy_rate, sell_rate, brokerage_rate
 
 class ZerodhaFeeCalculator:
     """Calculate all trading fees and taxes for Zerodha"""
 
+    # Fixed attribute set: no per-instance __dict__, and attribute
+    # reads in the hot fee loops become fixed-offset slot loads
+    __slots__ = ("fees", "_rate_table")
+
     def __init__(self):
-        self.fees = ZerodhaFeeStructure()
+        self.fees = FEES
+        self._rate_table = _build_rate_table()
 
     def calculate_brokerage(self, quantity: int, price: float, trade_type: str = "intraday") -> float:
         """
@@ -32,8 +139,9 @@ class ZerodhaFeeCalculator:
         if trade_type.lower() == "delivery":
             return 0.0  # Free for delivery
         else:  # intraday
-            brokerage_percent = turnover * self.fees.INTRADAY_BROKERAGE_PERCENT
-            return min(brokerage_percent, self.fees.INTRADAY_BROKERAGE_MAX)
+            fees = self.fees
+            brokerage_percent = turnover * fees.INTRADAY_BROKERAGE_PERCENT
+            return min(brokerage_percent, fees.INTRADAY_BROKERAGE_MAX)
 
     def calculate_stt(self, quantity: int, buy_price: float, sell_price: float, trade_type: str = "intraday") -> float:
         """
@@ -48,19 +156,20 @@ class ZerodhaFeeCalculator:
         Returns:
             STT amount in Rs
         """
+        fees = self.fees
         if trade_type.lower() == "delivery":
             # STT on both buy and sell for delivery
             buy_turnover = quantity * buy_price
             sell_turnover = quantity * sell_price
 
-            stt_buy = buy_turnover * self.fees.STT_DELIVERY_BUY
-            stt_sell = sell_turnover * self.fees.STT_DELIVERY_SELL
+            stt_buy = buy_turnover * fees.STT_DELIVERY_BUY
+            stt_sell = sell_turnover * fees.STT_DELIVERY_SELL
 
             return stt_buy + stt_sell
         else:  # intraday
             # STT only on sell side for intraday
             sell_turnover = quantity * sell_price
-            return sell_turnover * self.fees.STT_INTRADAY_SELL
+            return sell_turnover * fees.STT_INTRADAY_SELL
 
     def calculate_transaction_charges(self, quantity: int, price: float, exchange: str = "NSE") -> float:
         """
@@ -128,11 +237,15 @@ class ZerodhaFeeCalculator:
         taxable_amount = brokerage + transaction_charges
         return taxable_amount * self.fees.GST_RATE
 
-    def calculate_total_charges(self, quantity: int, buy_price: float, sell_price: float, 
-                              trade_type: str = "intraday", exchange: str = "NSE",
-                              include_dp_charges: bool = False) -> dict:
+    def compute_charges(self, quantity: int, buy_price: float, sell_price: float,
+                        trade_type: str = "intraday", exchange: str = "NSE",
+                        include_dp_charges: bool = False) -> "FeeResult":
         """
-        Calculate all charges for a complete trade
+        Calculate all charges for a complete trade as a FeeResult
+
+        One flat tuple allocation with attribute access, instead of the
+        three nested dicts the legacy calculate_total_charges wraps
+        around this.
 
         Args:
             quantity: Number of shares
@@ -143,28 +256,34 @@ class ZerodhaFeeCalculator:
             include_dp_charges: Whether to include DP charges (for selling from demat)
 
         Returns:
-            Dictionary with breakdown of all charges
+            FeeResult with rounded charge components and trade details
         """
-        # Calculate individual charges
-        brokerage_buy = self.calculate_brokerage(quantity, buy_price, trade_type)
-        brokerage_sell = self.calculate_brokerage(quantity, sell_price, trade_type)
+        # Normalize the dispatch key once; everything below is a plain
+        # bundle field read with no string compares
+        trade_key = trade_type.lower()
+        exchange_key = exchange.upper()
+        rb = self._rate_table[(trade_key, exchange_key)]
+
+        # Buy side is memoized (sell-price searches reuse it); sell side
+        # is one turnover multiply per aggregated rate
+        (brokerage_buy, stt_buy, transaction_charges_buy,
+         sebi_charges_buy, stamp_duty) = _buy_side_fees(
+            quantity, buy_price, trade_key, exchange_key)
+
+        sell_turnover = quantity * sell_price
+        brokerage_sell = min(sell_turnover * rb.brokerage_rate, rb.brokerage_max)
         total_brokerage = brokerage_buy + brokerage_sell
 
-        stt = self.calculate_stt(quantity, buy_price, sell_price, trade_type)
-
-        transaction_charges_buy = self.calculate_transaction_charges(quantity, buy_price, exchange)
-        transaction_charges_sell = self.calculate_transaction_charges(quantity, sell_price, exchange)
-        total_transaction_charges = transaction_charges_buy + transaction_charges_sell
-
-        sebi_charges_buy = self.calculate_sebi_charges(quantity, buy_price)
-        sebi_charges_sell = self.calculate_sebi_charges(quantity, sell_price)
-        total_sebi_charges = sebi_charges_buy + sebi_charges_sell
+        stt = stt_buy + sell_turnover * rb.stt_sell
+        total_transaction_charges = transaction_charges_buy + sell_turnover * rb.txn
+        total_sebi_charges = sebi_charges_buy + sell_turnover * rb.sebi
 
-        stamp_duty = self.calculate_stamp_duty(quantity, buy_price, trade_type)
+        # Hoist the fee structure once; inline GST rather than paying a
+        # method call on the hot path
+        fees = self.fees
+        gst = (total_brokerage + total_transaction_charges) * fees.GST_RATE
 
-        gst = self.calculate_gst(total_brokerage, total_transaction_charges)
-
-        dp_charges = self.fees.DP_CHARGES if include_dp_charges else 0.0
+        dp_charges = fees.DP_CHARGES if include_dp_charges else 0.0
 
         # Calculate totals
         total_charges = (total_brokerage + stt + total_transaction_charges + 
@@ -174,34 +293,160 @@ class ZerodhaFeeCalculator:
         gross_profit = (sell_price - buy_price) * quantity
         net_profit = gross_profit - total_charges
 
+        return FeeResult(
+            brokerage=round(total_brokerage, 2),
+            stt=round(stt, 2),
+            transaction_charges=round(total_transaction_charges, 2),
+            sebi_charges=round(total_sebi_charges, 2),
+            stamp_duty=round(stamp_duty, 2),
+            gst=round(gst, 2),
+            dp_charges=round(dp_charges, 2),
+            total_charges=round(total_charges, 2),
+            gross_profit=round(gross_profit, 2),
+            net_profit=round(net_profit, 2),
+            net_profit_percent=round((net_profit / (quantity * buy_price)) * 100, 3),
+            quantity=quantity,
+            buy_price=buy_price,
+            sell_price=sell_price,
+            buy_value=quantity * buy_price,
+            sell_value=quantity * sell_price,
+            trade_type=trade_type,
+            exchange=exchange,
+        )
+
+    def calculate_total_charges(self, quantity: int, buy_price: float, sell_price: float,
+                              trade_type: str = "intraday", exchange: str = "NSE",
+                              include_dp_charges: bool = False) -> dict:
+        """
+        Calculate all charges for a complete trade
+
+        Legacy dict view over compute_charges; hot paths should call
+        compute_charges directly and read attributes.
+
+        Args:
+            quantity: Number of shares
+            buy_price: Purchase price per share
+            sell_price: Selling price per share
+            trade_type: "delivery" or "intraday"
+            exchange: "NSE" or "BSE"
+            include_dp_charges: Whether to include DP charges (for selling from demat)
+
+        Returns:
+            Dictionary with breakdown of all charges
+        """
+        r = self.compute_charges(quantity, buy_price, sell_price,
+                                 trade_type, exchange, include_dp_charges)
         return {
             "breakdown": {
-                "brokerage": round(total_brokerage, 2),
-                "stt": round(stt, 2),
-                "transaction_charges": round(total_transaction_charges, 2),
-                "sebi_charges": round(total_sebi_charges, 2),
-                "stamp_duty": round(stamp_duty, 2),
-                "gst": round(gst, 2),
-                "dp_charges": round(dp_charges, 2)
+                "brokerage": r.brokerage,
+                "stt": r.stt,
+                "transaction_charges": r.transaction_charges,
+                "sebi_charges": r.sebi_charges,
+                "stamp_duty": r.stamp_duty,
+                "gst": r.gst,
+                "dp_charges": r.dp_charges
             },
             "totals": {
-                "total_charges": round(total_charges, 2),
-                "gross_profit": round(gross_profit, 2),
-                "net_profit": round(net_profit, 2),
-                "net_profit_percent": round((net_profit / (quantity * buy_price)) * 100, 3)
+                "total_charges": r.total_charges,
+                "gross_profit": r.gross_profit,
+                "net_profit": r.net_profit,
+                "net_profit_percent": r.net_profit_percent
             },
             "trade_details": {
-                "quantity": quantity,
-                "buy_price": buy_price,
-                "sell_price": sell_price,
-                "buy_value": quantity * buy_price,
-                "sell_value": quantity * sell_price,
-                "trade_type": trade_type,
-                "exchange": exchange
+                "quantity": r.quantity,
+                "buy_price": r.buy_price,
+                "sell_price": r.sell_price,
+                "buy_value": r.buy_value,
+                "sell_value": r.sell_value,
+                "trade_type": r.trade_type,
+                "exchange": r.exchange
             }
         }
 
-    def is_trade_profitable(self, quantity: int, buy_price: float, sell_price: float, 
+    def calculate_total_charges_batch(self, quantity, buy_price, sell_price,
+                                      trade_type: str = "intraday",
+                                      exchange: str = "NSE",
+                                      include_dp_charges: bool = False) -> dict:
+        """
+        Vectorized calculate_total_charges over arrays of trades
+
+        Computes the same charge components as calculate_total_charges
+        but for whole arrays in single NumPy passes, so screening N
+        candidate trades costs N-element elementwise ops instead of N
+        Python-level calls.
+
+        Args:
+            quantity: Array of share counts
+            buy_price: Array of purchase prices per share
+            sell_price: Array of selling prices per share
+            trade_type: "delivery" or "intraday" (applies to the batch)
+            exchange: "NSE" or "BSE" (applies to the batch)
+            include_dp_charges: Whether to include DP charges
+
+        Returns:
+            Dictionary of arrays keyed like the scalar breakdown/totals
+        """
+        fees = self.fees
+        # C-contiguous float64 keeps every elementwise op (including the
+        # np.minimum brokerage cap) on NumPy's vectorized fast path even
+        # when callers hand in DataFrame column slices
+        quantity = np.ascontiguousarray(quantity, dtype=np.float64)
+        buy_price = np.ascontiguousarray(buy_price, dtype=np.float64)
+        sell_price = np.ascontiguousarray(sell_price, dtype=np.float64)
+
+        buy_turnover = quantity * buy_price
+        sell_turnover = quantity * sell_price
+        total_turnover = buy_turnover + sell_turnover
+
+        if exchange.upper() == "NSE":
+            txn_rate = fees.NSE_TRANSACTION_CHARGES
+        else:
+            txn_rate = fees.BSE_TRANSACTION_CHARGES
+
+        if trade_type.lower() == "delivery":
+            brokerage = np.zeros_like(buy_turnover)
+            stt = (buy_turnover * fees.STT_DELIVERY_BUY +
+                   sell_turnover * fees.STT_DELIVERY_SELL)
+            stamp_duty = buy_turnover * fees.STAMP_DUTY_DELIVERY
+        else:
+            brokerage = (np.minimum(buy_turnover * fees.INTRADAY_BROKERAGE_PERCENT,
+                                    fees.INTRADAY_BROKERAGE_MAX) +
+                         np.minimum(sell_turnover * fees.INTRADAY_BROKERAGE_PERCENT,
+                                    fees.INTRADAY_BROKERAGE_MAX))
+            stt = sell_turnover * fees.STT_INTRADAY_SELL
+            stamp_duty = buy_turnover * fees.STAMP_DUTY_INTRADAY
+
+        transaction_charges = total_turnover * txn_rate
+        sebi_charges = total_turnover * fees.SEBI_CHARGES
+        gst = (brokerage + transaction_charges) * fees.GST_RATE
+        dp_charges = fees.DP_CHARGES if include_dp_charges else 0.0
+
+        total_charges = (brokerage + stt + transaction_charges +
+                         sebi_charges + stamp_duty + gst + dp_charges)
+        gross_profit = (sell_price - buy_price) * quantity
+        net_profit = gross_profit - total_charges
+
+        # One in-place rounding sweep over a stacked block instead of a
+        # np.round call per column; the percent column keeps 3 decimals
+        out = np.stack([brokerage, stt, transaction_charges, sebi_charges,
+                        stamp_duty, gst, total_charges, gross_profit,
+                        net_profit])
+        np.round(out, 2, out=out)
+
+        return {
+            "brokerage": out[0],
+            "stt": out[1],
+            "transaction_charges": out[2],
+            "sebi_charges": out[3],
+            "stamp_duty": out[4],
+            "gst": out[5],
+            "total_charges": out[6],
+            "gross_profit": out[7],
+            "net_profit": out[8],
+            "net_profit_percent": np.round(net_profit / buy_turnover * 100, 3),
+        }
+
+    def is_trade_profitable(self, quantity: int, buy_price: float, sell_price: float,
                            min_profit_percent: float = 0.1, trade_type: str = "intraday",
                            exchange: str = "NSE") -> tuple:
         """
@@ -218,18 +463,86 @@ class ZerodhaFeeCalculator:
         Returns:
             Tuple of (is_profitable: bool, net_profit: float, profit_percent: float)
         """
-        charges = self.calculate_total_charges(quantity, buy_price, sell_price, 
-                                             trade_type, exchange)
+        # Pure scalar path: charge total from the aggregate rates, no
+        # FeeResult allocation for the breakdown nobody reads here
+        total_charges = self._fast_total(quantity, buy_price, sell_price,
+                                         trade_type, exchange)
+        net = (sell_price - buy_price) * quantity - total_charges
 
-        net_profit = charges["totals"]["net_profit"]
-        profit_percent = charges["totals"]["net_profit_percent"]
+        net_profit = round(net, 2)
+        profit_percent = round((net / (quantity * buy_price)) * 100, 3)
 
         is_profitable = profit_percent >= min_profit_percent
 
         return is_profitable, net_profit, profit_percent
 
-    def get_minimum_profitable_price(self, quantity: int, buy_price: float, 
-                                   min_profit_percent: float = 0.1, 
+    def _solve_break_even_sell(self, quantity: int, buy_price: float,
+                               min_profit_percent: float, trade_type: str,
+                               exchange: str) -> float:
+        """
+        Solve the break-even sell price in closed form
+
+        All charges are linear in turnover except the intraday brokerage
+        cap, so the sell price where net profit hits the target is the
+        root of a single linear equation:
+
+            (S - B)*Q - F_buy - k*Q*S = (target/100)*Q*B
+
+        where F_buy is the sell-independent charge total and k the
+        aggregate per-rupee sell-side rate. The brokerage cap is handled
+        by solving the uncapped branch first and re-solving with the cap
+        folded into the fixed charges if the solution crosses it.
+
+        Returns:
+            Exact (unrounded) break-even sell price
+        """
+        fees = self.fees
+        buy_rate, base_rate, brokerage_rate = _aggregate_rates(trade_type, exchange)
+        gst = 1.0 + fees.GST_RATE
+        buy_turnover = quantity * buy_price
+        target = min_profit_percent / 100.0
+
+        fixed = buy_turnover * buy_rate
+        if brokerage_rate == 0.0:  # delivery: no cap, fully linear
+            return ((buy_price * (1.0 + target) + fixed / quantity) /
+                    (1.0 - base_rate))
+
+        fixed += gst * min(buy_turnover * brokerage_rate, fees.INTRADAY_BROKERAGE_MAX)
+
+        # Assume the sell-side brokerage is below its cap...
+        sell_rate = base_rate + gst * brokerage_rate
+        sell_price = ((buy_price * (1.0 + target) + fixed / quantity) /
+                      (1.0 - sell_rate))
+
+        # ...and re-solve with the cap as a fixed charge if it crossed it
+        if quantity * sell_price * brokerage_rate > fees.INTRADAY_BROKERAGE_MAX:
+            fixed += gst * fees.INTRADAY_BROKERAGE_MAX
+            sell_price = ((buy_price * (1.0 + target) + fixed / quantity) /
+                          (1.0 - base_rate))
+
+        return sell_price
+
+    def _fast_total(self, quantity: int, buy_price: float, sell_price: float,
+                    trade_type: str = "intraday", exchange: str = "NSE") -> float:
+        """
+        Total charges only: two turnover multiplies plus the brokerage cap
+
+        Skips the per-component breakdown entirely; used by hot paths
+        that just need the charge total.
+        """
+        buy_rate, sell_rate, brokerage_rate = _aggregate_rates(trade_type, exchange)
+        buy_turnover = quantity * buy_price
+        sell_turnover = quantity * sell_price
+        total = buy_turnover * buy_rate + sell_turnover * sell_rate
+        if brokerage_rate:
+            gst = 1.0 + self.fees.GST_RATE
+            brokerage_max = self.fees.INTRADAY_BROKERAGE_MAX
+            total += gst * (min(buy_turnover * brokerage_rate, brokerage_max) +
+                            min(sell_turnover * brokerage_rate, brokerage_max))
+        return total
+
+    def get_minimum_profitable_price(self, quantity: int, buy_price: float,
+                                   min_profit_percent: float = 0.1,
                                    trade_type: str = "intraday",
                                    exchange: str = "NSE") -> float:
         """
@@ -245,23 +558,115 @@ class ZerodhaFeeCalculator:
         Returns:
             Minimum selling price for profitable trade
         """
-        # Start with a rough estimate and iterate
-        sell_price = buy_price * 1.01  # Start with 1% higher
-
-        for _ in range(100):  # Maximum iterations
-            is_profitable, _, profit_percent = self.is_trade_profitable(
-                quantity, buy_price, sell_price, min_profit_percent, trade_type, exchange
+        # Closed-form solve, rounded up to the next paisa so the result
+        # stays on the profitable side of the break-even point
+        break_even = self._solve_break_even_sell(
+            quantity, buy_price, min_profit_percent, trade_type, exchange)
+        sell_price = math.ceil(break_even * 100.0) / 100.0
+
+        is_profitable, _, _ = self.is_trade_profitable(
+            quantity, buy_price, sell_price, min_profit_percent, trade_type, exchange)
+        if is_profitable:
+            return sell_price
+
+        # Bisection fallback for rounding corner cases near the
+        # break-even point: ~20 halvings of [buy_price, 2*buy_price]
+        # instead of a 100-step linear scan
+        lo, hi = buy_price, buy_price * 2.0
+        while hi - lo >= 0.01:
+            mid = (lo + hi) / 2.0
+            is_profitable, _, _ = self.is_trade_profitable(
+                quantity, buy_price, mid, min_profit_percent, trade_type, exchange
             )
-
             if is_profitable:
-                if profit_percent > min_profit_percent + 0.01:  # Too much profit, reduce
-                    sell_price -= 0.01
-                else:  # Close enough
-                    break
-            else:  # Not profitable yet, increase
-                sell_price += 0.01
-
-        return round(sell_price, 2)
+                hi = mid
+            else:
+                lo = mid
+
+        return math.ceil(hi * 100.0) / 100.0
+
+class IntradayFeeCalculator(ZerodhaFeeCalculator):
+    """
+    Fee calculator specialized for intraday trades
+
+    The trade type is known for the session, so the per-method string
+    compares are folded away: every override is the intraday branch of
+    its base method. A conflicting trade_type argument still gets the
+    base dispatch, so the answer never disagrees with compute_charges.
+    """
+
+    __slots__ = ()
+
+    def calculate_brokerage(self, quantity: int, price: float, trade_type: str = "intraday") -> float:
+        if trade_type != "intraday":
+            return super().calculate_brokerage(quantity, price, trade_type)
+        fees = self.fees
+        return min(quantity * price * fees.INTRADAY_BROKERAGE_PERCENT,
+                   fees.INTRADAY_BROKERAGE_MAX)
+
+    def calculate_stt(self, quantity: int, buy_price: float, sell_price: float, trade_type: str = "intraday") -> float:
+        if trade_type != "intraday":
+            return super().calculate_stt(quantity, buy_price, sell_price, trade_type)
+        return quantity * sell_price * self.fees.STT_INTRADAY_SELL
+
+    def calculate_stamp_duty(self, quantity: int, price: float, trade_type: str = "intraday") -> float:
+        if trade_type != "intraday":
+            return super().calculate_stamp_duty(quantity, price, trade_type)
+        return quantity * price * self.fees.STAMP_DUTY_INTRADAY
+
+class DeliveryFeeCalculator(ZerodhaFeeCalculator):
+    """
+    Fee calculator specialized for delivery trades
+
+    Brokerage is free on delivery, so its override is a constant;
+    the remaining overrides pin the delivery rates and default every
+    trade_type argument to "delivery". A conflicting trade_type falls
+    back to the base dispatch rather than being silently ignored.
+    """
+
+    __slots__ = ()
+
+    def calculate_brokerage(self, quantity: int, price: float, trade_type: str = "delivery") -> float:
+        if trade_type != "delivery":
+            return super().calculate_brokerage(quantity, price, trade_type)
+        return 0.0
+
+    def calculate_stt(self, quantity: int, buy_price: float, sell_price: float, trade_type: str = "delivery") -> float:
+        if trade_type != "delivery":
+            return super().calculate_stt(quantity, buy_price, sell_price, trade_type)
+        fees = self.fees
+        return quantity * (buy_price * fees.STT_DELIVERY_BUY +
+                           sell_price * fees.STT_DELIVERY_SELL)
+
+    def calculate_stamp_duty(self, quantity: int, price: float, trade_type: str = "delivery") -> float:
+        if trade_type != "delivery":
+            return super().calculate_stamp_duty(quantity, price, trade_type)
+        return quantity * price * self.fees.STAMP_DUTY_DELIVERY
+
+    def compute_charges(self, quantity: int, buy_price: float, sell_price: float,
+                        trade_type: str = "delivery", exchange: str = "NSE",
+                        include_dp_charges: bool = False) -> FeeResult:
+        return super().compute_charges(quantity, buy_price, sell_price,
+                                       trade_type, exchange, include_dp_charges)
+
+    def calculate_total_charges(self, quantity: int, buy_price: float, sell_price: float,
+                              trade_type: str = "delivery", exchange: str = "NSE",
+                              include_dp_charges: bool = False) -> dict:
+        return super().calculate_total_charges(quantity, buy_price, sell_price,
+                                               trade_type, exchange, include_dp_charges)
+
+    def is_trade_profitable(self, quantity: int, buy_price: float, sell_price: float,
+                           min_profit_percent: float = 0.1, trade_type: str = "delivery",
+                           exchange: str = "NSE") -> tuple:
+        return super().is_trade_profitable(quantity, buy_price, sell_price,
+                                           min_profit_percent, trade_type, exchange)
+
+    def get_minimum_profitable_price(self, quantity: int, buy_price: float,
+                                   min_profit_percent: float = 0.1,
+                                   trade_type: str = "delivery",
+                                   exchange: str = "NSE") -> float:
+        return super().get_minimum_profitable_price(quantity, buy_price,
+                                                    min_profit_percent, trade_type, exchange)
 
 # Example usage and testing
 if __name__ == "__main__":
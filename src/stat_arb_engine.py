@@ -3,36 +3,174 @@ Statistical Arbitrage Engine
 Handles pair identification, cointegration testing, and trading signals
 """
 
+import bottleneck as bn
 import numpy as np
 import pandas as pd
 import yfinance as yf
-from scipy import stats
-from statsmodels.tsa.stattools import coint, adfuller
-from sklearn.linear_model import LinearRegression
 import warnings
 import logging
+import pickle
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import sys
 import os
+from dataclasses import dataclass
 
 # Add parent directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from config.config import TradingConfig, PairTradingConfig
+from config.config import TradingConfig, PairTradingConfig, candidate_pairs
 from src.fee_calculator import ZerodhaFeeCalculator
 
-warnings.filterwarnings('ignore')
+# Daily disk cache for fetched price data; keyed by (symbol, period, date)
+# so the first run of a session pays the Yahoo round-trip and later runs
+# (or crashed/restarted sessions) read a local pickle instead.
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', 'data', 'engine_cache')
+
+# Only the screening period is day-cacheable on disk; shorter periods
+# (e.g. the monitor's '5d') must track intraday quotes
+_DISK_CACHE_PERIOD = '1y'
+
+def _spread_arr(p1: np.ndarray, p2: np.ndarray, beta: float, alpha: float) -> np.ndarray:
+    """Spread p2 - beta*p1 - alpha with one output allocation."""
+    out = p2 - beta * p1
+    out -= alpha
+    return out
+
+@dataclass(slots=True)
+class PairArrays:
+    """Aligned pair prices in structure-of-arrays form
+
+    The whole pair pipeline (cointegration, spread, z-score) works off
+    the same alignment, so it is computed once per pair and carried as
+    two parallel float64 arrays plus the shared index.
+    """
+    index: pd.Index
+    p1: np.ndarray
+    p2: np.ndarray
+
+def _cache_path(symbol: str, period: str) -> str:
+    """Build the on-disk cache path for a (symbol, period, today) key."""
+    safe_symbol = symbol.replace('.', '_')
+    today = time.strftime('%Y%m%d')
+    return os.path.join(_CACHE_DIR, f"{safe_symbol}_{period}_{today}.pkl")
+
+def _signals_kernel(z, entry_z, exit_z, stop_z):
+    """
+    Run the signal state machine over a raw z-score array
+
+    Operates on plain ndarrays with scalar thresholds instead of
+    per-row DataFrame iloc get/set, which dominated analyze_pair's
+    runtime. Returns (signal, position, entry, exit, stop_hits) where
+    signal and position are int8 arrays, entry and exit are bool arrays
+    marking transitions, and stop_hits counts stop-loss exits.
+
+    Args:
+        z: Z-score values as a float ndarray
+        entry_z: Entry threshold
+        exit_z: Exit threshold
+        stop_z: Stop-loss threshold
+
+    Returns:
+        Tuple of (signal, position, entry, exit, stop_hits)
+    """
+    n = z.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+    position = np.zeros(n, dtype=np.int8)
+    entry = np.zeros(n, dtype=np.bool_)
+    exit_ = np.zeros(n, dtype=np.bool_)
+    current_position = 0
+    stop_hits = 0
+
+    for i in range(1, n):
+        z_current = z[i]
+
+        if z_current != z_current:  # NaN: hold state
+            position[i] = current_position
+            continue
+
+        if current_position == 0:  # No position
+            if z_current > entry_z:
+                # Spread too high, short the pair (short stock2, long stock1)
+                signal[i] = -1
+                current_position = -1
+            elif z_current < -entry_z:
+                # Spread too low, long the pair (long stock2, short stock1)
+                signal[i] = 1
+                current_position = 1
+        else:
+            abs_z = z_current if z_current >= 0.0 else -z_current
+            if abs_z < exit_z:
+                # Close position
+                signal[i] = -current_position
+                current_position = 0
+            elif abs_z > stop_z:
+                # Stop loss
+                signal[i] = -current_position
+                current_position = 0
+                stop_hits += 1
+
+        position[i] = current_position
+
+        # Transition flags in the same pass (replaces the pandas
+        # .shift() comparisons downstream)
+        s = signal[i]
+        if s != 0:
+            entry[i] = s != signal[i - 1]
+            exit_[i] = position[i - 1] != 0
+
+    return signal, position, entry, exit_, stop_hits
 
 class StatisticalArbitrageEngine:
     """Main engine for statistical arbitrage trading"""
 
+    # Process-wide runtime config applied by the first engine built
+    _runtime_configured = False
+
     def __init__(self):
+        if not StatisticalArbitrageEngine._runtime_configured:
+            # Suppress the pandas/statsmodels warning chatter once per
+            # process instead of re-filtering in the inner loop, and
+            # silence numpy FP warnings (z-scores divide by early-window
+            # NaN/zero std by design)
+            warnings.filterwarnings('ignore')
+            np.seterr(all='ignore')
+            pd.options.mode.chained_assignment = None
+
+            # Warm statsmodels' ADF machinery and MacKinnon tables on a
+            # tiny series so the first real pair doesn't pay the
+            # cold-call latency. statsmodels is imported lazily — it
+            # costs several hundred ms that pure fee-calculator users
+            # never need to pay.
+            # (statsmodels force-registers an 'always' filter for its
+            # collinearity warning at import, so suppress locally)
+            try:
+                from statsmodels.tsa.stattools import coint
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    coint(np.linspace(1, 2, 40), np.linspace(1, 2, 40),
+                          maxlag=1, autolag=None)
+            except Exception:
+                pass
+
+            StatisticalArbitrageEngine._runtime_configured = True
+
         self.trading_config = TradingConfig()
         self.pair_config = PairTradingConfig()
         self.fee_calculator = ZerodhaFeeCalculator()
         self.logger = self._setup_logger()
         self.pairs_data = {}
         self.active_signals = {}
+        self._analysis_cache = {}
+        # In-memory frames expire on the data-refresh cadence so the
+        # live monitor sees fresh quotes; entries are (fetched_at, frame)
+        self._price_cache = {}
+        self._price_ttl = self.trading_config.DATA_REFRESH_MINUTES * 60
+        self._coint_cache = {}
+        self._last_alignment = None
 
     def _setup_logger(self):
         """Setup logging configuration"""
@@ -46,6 +184,80 @@ class StatisticalArbitrageEngine:
         )
         return logging.getLogger('StatArb')
 
+    def _prefetch_universe(self, symbols, period: str = "1y"):
+        """
+        Fetch history for many symbols in one batched download
+
+        Screening fetches every symbol in the pair universe; a single
+        yf.download call amortizes the network round-trip that
+        per-symbol Ticker().history() pays 2x per pair.
+
+        Args:
+            symbols: Iterable of stock symbols
+            period: Data period ('1y', '6mo', '3mo', etc.)
+        """
+        now = time.time()
+        wanted = []
+        for symbol in sorted(set(symbols)):
+            cached = self._price_cache.get((symbol, period))
+            if cached is not None and now - cached[0] < self._price_ttl:
+                continue
+            frame = (self._load_cached_frame(symbol, period)
+                     if period == _DISK_CACHE_PERIOD else None)
+            if frame is not None:
+                self._price_cache[(symbol, period)] = (now, frame)
+            else:
+                wanted.append(symbol)
+        if not wanted:
+            return
+
+        try:
+            data = yf.download(tickers=wanted, period=period, group_by='ticker',
+                               threads=True, progress=False)
+        except Exception as e:
+            self.logger.error("Batched download failed: %s", str(e))
+            return
+
+        for symbol in wanted:
+            try:
+                frame = data[symbol] if len(wanted) > 1 else data
+            except KeyError:
+                continue
+            frame = frame.dropna()
+            if frame.empty:
+                continue
+            frame = frame.copy()
+            frame['Symbol'] = symbol
+            self._price_cache[(symbol, period)] = (time.time(), frame)
+            if period == _DISK_CACHE_PERIOD:
+                self._store_cached_frame(symbol, period, frame)
+
+        self.logger.info("Prefetched %d symbols in one batch", len(wanted))
+
+    def _load_cached_frame(self, symbol: str, period: str):
+        """Read today's cached frame for a symbol from disk, if present."""
+        path = _cache_path(symbol, period)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            self.logger.warning("Could not read cache for %s: %s", symbol, str(e))
+            return None
+
+    def _store_cached_frame(self, symbol: str, period: str, frame: pd.DataFrame):
+        """Persist a fetched frame to the daily disk cache (atomically)."""
+        path = _cache_path(symbol, period)
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning("Could not write cache for %s: %s", symbol, str(e))
+
     def fetch_stock_data(self, symbol: str, period: str = "1y") -> pd.DataFrame:
         """
         Fetch stock data from Yahoo Finance
@@ -57,25 +269,72 @@ class StatisticalArbitrageEngine:
         Returns:
             DataFrame with stock data
         """
+        cached = self._price_cache.get((symbol, period))
+        if cached is not None and time.time() - cached[0] < self._price_ttl:
+            return cached[1]
+
+        if period == _DISK_CACHE_PERIOD:
+            frame = self._load_cached_frame(symbol, period)
+            if frame is not None:
+                self._price_cache[(symbol, period)] = (time.time(), frame)
+                return frame
+
         try:
             stock = yf.Ticker(symbol)
             data = stock.history(period=period)
 
             if data.empty:
-                self.logger.warning(f"No data found for {symbol}")
+                self.logger.warning("No data found for %s", symbol)
                 return pd.DataFrame()
 
             # Clean the data
             data = data.dropna()
             data['Symbol'] = symbol
 
-            self.logger.info(f"Fetched {len(data)} days of data for {symbol}")
+            self._price_cache[(symbol, period)] = (time.time(), data)
+            if period == _DISK_CACHE_PERIOD:
+                self._store_cached_frame(symbol, period, data)
+
+            self.logger.info("Fetched %d days of data for %s", len(data), symbol)
             return data
 
         except Exception as e:
-            self.logger.error(f"Error fetching data for {symbol}: {str(e)}")
+            self.logger.error("Error fetching data for %s: %s", symbol, str(e))
             return pd.DataFrame()
 
+    def _align(self, price_series_1: pd.Series, price_series_2: pd.Series) -> PairArrays:
+        """
+        Align two price series into parallel float64 arrays
+
+        Memoized by series identity so the pipeline pays for the join
+        and NaN drop once per pair instead of once per helper.
+
+        Args:
+            price_series_1: First stock price series
+            price_series_2: Second stock price series
+
+        Returns:
+            PairArrays with the shared index and aligned arrays
+        """
+        cached = self._last_alignment
+        if (cached is not None and cached[0] is price_series_1
+                and cached[1] is price_series_2):
+            return cached[2]
+
+        s1, s2 = price_series_1.align(price_series_2, join='inner')
+        p1 = s1.to_numpy(dtype=np.float64)
+        p2 = s2.to_numpy(dtype=np.float64)
+        index = s1.index
+        mask = ~(np.isnan(p1) | np.isnan(p2))
+        if not mask.all():
+            p1 = p1[mask]
+            p2 = p2[mask]
+            index = index[mask]
+
+        pair = PairArrays(index, p1, p2)
+        self._last_alignment = (price_series_1, price_series_2, pair)
+        return pair
+
     def test_cointegration(self, price_series_1: pd.Series, price_series_2: pd.Series) -> dict:
         """
         Test for cointegration between two price series
@@ -88,13 +347,20 @@ class StatisticalArbitrageEngine:
             Dictionary with cointegration test results
         """
         try:
-            # Align the series by index
-            aligned_data = pd.DataFrame({
-                'stock1': price_series_1,
-                'stock2': price_series_2
-            }).dropna()
-
-            if len(aligned_data) < 30:  # Need sufficient data
+            # Align once into parallel arrays; the downstream helpers
+            # reuse the same alignment
+            pair = self._align(price_series_1, price_series_2)
+            x = pair.p1
+            y = pair.p2
+
+            # Memoize on the aligned data itself: coint() costs 5-50 ms
+            # and screening re-tests identical series within a session
+            cache_key = (hash(x.tobytes()), hash(y.tobytes()))
+            cached = self._coint_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            if x.size < 30:  # Need sufficient data
                 return {
                     'cointegrated': False,
                     'p_value': 1.0,
@@ -103,32 +369,74 @@ class StatisticalArbitrageEngine:
                     'error': 'Insufficient data'
                 }
 
-            # Perform Engle-Granger cointegration test
-            coint_result = coint(aligned_data['stock1'], aligned_data['stock2'])
+            # Cheap correlation gate first: Pearson correlation is
+            # 10-50x cheaper than Engle-Granger, and most candidate
+            # pairs fail long before the cointegration stage
+            xm = x.mean()
+            ym = y.mean()
+            dx = x - xm
+            dy = y - ym
+            dxdy = dx @ dy
+            dxdx = dx @ dx
+            dydy = dy @ dy
+            correlation = float(dxdy / np.sqrt(dxdx * dydy))
+
+            if abs(correlation) < self.pair_config.MIN_CORRELATION:
+                result = {
+                    'cointegrated': False,
+                    'p_value': 1.0,
+                    'reason': 'low_corr',
+                    'correlation': correlation
+                }
+                self._coint_cache[cache_key] = result
+                return result
+
+            # Perform Engle-Granger cointegration test with a fixed ADF
+            # lag: the default autolag='aic' refits the ADF for every
+            # candidate lag and dominates the screening cost. With
+            # autolag=None the maxlag IS the lag actually used, so keep
+            # it small — fixing the Schwert search ceiling (15 at n=300)
+            # as the lag wrecks test power on daily data.
+            maxlag = self.pair_config.COINT_MAXLAG
+            # Lazy import (cached in sys.modules after the warm-up call)
+            from statsmodels.tsa.stattools import coint
+            # Localized suppression so coint stays quiet even if a
+            # caller has reset the global warning filters
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                coint_result = coint(x, y, trend='c', maxlag=maxlag,
+                                     autolag=None)
             p_value = coint_result[1]
             critical_value = coint_result[2][1]  # 5% critical value
 
-            # Calculate hedge ratio using linear regression
-            lr = LinearRegression()
-            X = aligned_data['stock1'].values.reshape(-1, 1)
-            y = aligned_data['stock2'].values
-            lr.fit(X, y)
-            hedge_ratio = lr.coef_[0]
+            # Hedge ratio via closed-form OLS, reusing the centered
+            # moments from the correlation gate; coint() has internally
+            # fit the same regression, so a second pass would just
+            # repeat the work
+            hedge_ratio = dxdy / dxdx
+            intercept = ym - hedge_ratio * xm
+            r_squared = (dxdy * dxdy) / (dxdx * dydy)
 
             is_cointegrated = p_value < self.pair_config.MAX_COINTEGRATION_PVALUE
 
-            return {
+            result = {
                 'cointegrated': is_cointegrated,
                 'p_value': p_value,
                 'critical_value': critical_value,
                 'hedge_ratio': hedge_ratio,
-                'intercept': lr.intercept_,
-                'r_squared': lr.score(X, y),
-                'data_points': len(aligned_data)
+                'intercept': intercept,
+                'r_squared': r_squared,
+                'correlation': correlation,
+                'data_points': int(x.size)
             }
 
+            if len(self._coint_cache) > 4 * len(self.pair_config.DEFAULT_PAIRS):
+                self._coint_cache.clear()
+            self._coint_cache[cache_key] = result
+            return result
+
         except Exception as e:
-            self.logger.error(f"Error in cointegration test: {str(e)}")
+            self.logger.error("Error in cointegration test: %s", str(e))
             return {
                 'cointegrated': False,
                 'p_value': 1.0,
@@ -150,19 +458,13 @@ class StatisticalArbitrageEngine:
             Spread series
         """
         try:
-            # Align the series
-            aligned_data = pd.DataFrame({
-                'stock1': price_series_1,
-                'stock2': price_series_2
-            }).dropna()
-
             # Calculate spread: stock2 - hedge_ratio * stock1 - intercept
-            spread = aligned_data['stock2'] - (hedge_ratio * aligned_data['stock1'] + intercept)
-
-            return spread
+            pair = self._align(price_series_1, price_series_2)
+            return pd.Series(_spread_arr(pair.p1, pair.p2, hedge_ratio, intercept),
+                             index=pair.index)
 
         except Exception as e:
-            self.logger.error(f"Error calculating spread: {str(e)}")
+            self.logger.error("Error calculating spread: %s", str(e))
             return pd.Series()
 
     def calculate_zscore(self, spread: pd.Series, window: int = None) -> pd.Series:
@@ -180,19 +482,23 @@ class StatisticalArbitrageEngine:
             window = self.trading_config.ROLLING_WINDOW
 
         try:
-            # Calculate rolling mean and standard deviation
-            rolling_mean = spread.rolling(window=window, min_periods=window//2).mean()
-            rolling_std = spread.rolling(window=window, min_periods=window//2).std()
-
-            # Calculate z-score
-            z_score = (spread - rolling_mean) / rolling_std
-
-            return z_score
+            arr = spread.to_numpy(dtype=np.float64)
+            return pd.Series(self._zscore_arr(arr, window), index=spread.index)
 
         except Exception as e:
-            self.logger.error(f"Error calculating z-score: {str(e)}")
+            self.logger.error("Error calculating z-score: %s", str(e))
             return pd.Series()
 
+    @staticmethod
+    def _zscore_arr(arr: np.ndarray, window: int) -> np.ndarray:
+        """Rolling z-score via bottleneck's single-pass C kernels
+
+        ddof=1 matches the pandas rolling std definition.
+        """
+        rolling_mean = bn.move_mean(arr, window, min_count=window//2)
+        rolling_std = bn.move_std(arr, window, min_count=window//2, ddof=1)
+        return (arr - rolling_mean) / rolling_std
+
     def generate_trading_signals(self, z_score: pd.Series, spread: pd.Series) -> pd.DataFrame:
         """
         Generate trading signals based on z-score
@@ -205,58 +511,35 @@ class StatisticalArbitrageEngine:
             DataFrame with trading signals
         """
         try:
-            signals = pd.DataFrame(index=z_score.index)
-            signals['z_score'] = z_score
-            signals['spread'] = spread
-            signals['signal'] = 0  # 0: no position, 1: long pair, -1: short pair
-            signals['position'] = 0  # Track current position
-
-            current_position = 0
-
-            for i in range(1, len(signals)):
-                z_current = signals.iloc[i]['z_score']
-
-                if pd.isna(z_current):
-                    signals.iloc[i, signals.columns.get_loc('signal')] = 0
-                    signals.iloc[i, signals.columns.get_loc('position')] = current_position
-                    continue
-
-                # Entry signals
-                if current_position == 0:  # No position
-                    if z_current > self.trading_config.Z_SCORE_ENTRY:
-                        # Spread too high, short the pair (short stock2, long stock1)
-                        signals.iloc[i, signals.columns.get_loc('signal')] = -1
-                        current_position = -1
-                    elif z_current < -self.trading_config.Z_SCORE_ENTRY:
-                        # Spread too low, long the pair (long stock2, short stock1)  
-                        signals.iloc[i, signals.columns.get_loc('signal')] = 1
-                        current_position = 1
-
-                # Exit signals
-                elif current_position != 0:
-                    if abs(z_current) < self.trading_config.Z_SCORE_EXIT:
-                        # Close position
-                        signals.iloc[i, signals.columns.get_loc('signal')] = -current_position
-                        current_position = 0
-                    # Stop loss
-                    elif abs(z_current) > self.trading_config.STOP_LOSS_MULTIPLIER:
-                        signals.iloc[i, signals.columns.get_loc('signal')] = -current_position
-                        current_position = 0
-                        self.logger.warning(f"Stop loss triggered at z-score: {z_current}")
-
-                signals.iloc[i, signals.columns.get_loc('position')] = current_position
-
-            # Add entry and exit points
-            signals['entry'] = (signals['signal'] != 0) & (signals['signal'] != signals['signal'].shift(1))
-            signals['exit'] = (signals['signal'] != 0) & (signals['position'].shift(1) != 0)
-
-            return signals
+            # Bind the thresholds to locals once; the kernel takes them
+            # as plain scalars
+            config = self.trading_config
+            entry_z = config.Z_SCORE_ENTRY
+            exit_z = config.Z_SCORE_EXIT
+            stop_z = config.STOP_LOSS_MULTIPLIER
+
+            z = z_score.to_numpy(dtype=np.float64)
+            signal, position, entry, exit_, stop_hits = _signals_kernel(
+                z, entry_z, exit_z, stop_z)
+
+            if stop_hits:
+                self.logger.warning("Stop loss triggered %d time(s)", stop_hits)
+
+            return pd.DataFrame({
+                'z_score': z_score,
+                'spread': spread,
+                'signal': signal,  # 0: no position, 1: long pair, -1: short pair
+                'position': position,  # Track current position
+                'entry': entry,
+                'exit': exit_
+            }, index=z_score.index)
 
         except Exception as e:
-            self.logger.error(f"Error generating trading signals: {str(e)}")
+            self.logger.error("Error generating trading signals: %s", str(e))
             return pd.DataFrame()
 
-    def analyze_pair(self, symbol1: str, symbol2: str, period: str = "1y") -> dict:
+    def analyze_pair(self, symbol1: str, symbol2: str, period: str = "1y",
+                     return_signals: bool = True) -> dict:
         """
         Complete analysis of a stock pair
 
@@ -264,12 +547,23 @@ class StatisticalArbitrageEngine:
             symbol1: First stock symbol
             symbol2: Second stock symbol
             period: Data period to analyze
+            return_signals: Include the recent signals table in the
+                            result; the screener turns this off since it
+                            only ranks pairs
 
         Returns:
             Complete pair analysis results
         """
+        # Memoize per minute: dashboard refreshes and signal checks often
+        # re-request the same pair well inside one data-refresh window.
+        cache_key = (symbol1, symbol2, period, return_signals,
+                     int(time.time() // 60))
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.info(f"Analyzing pair: {symbol1} - {symbol2}")
+            self.logger.info("Analyzing pair: %s - %s", symbol1, symbol2)
 
             # Fetch data for both stocks
             data1 = self.fetch_stock_data(symbol1, period)
@@ -286,27 +580,55 @@ class StatisticalArbitrageEngine:
             coint_result = self.test_cointegration(price1, price2)
 
             if not coint_result['cointegrated']:
-                return {
+                if coint_result.get('reason') == 'low_corr':
+                    reason = (f"Correlation {coint_result['correlation']:.2f} < "
+                              f"{self.pair_config.MIN_CORRELATION}")
+                else:
+                    reason = (f"P-value {coint_result['p_value']:.4f} > "
+                              f"{self.pair_config.MAX_COINTEGRATION_PVALUE}")
+                result = {
                     'pair': f"{symbol1} - {symbol2}",
                     'cointegrated': False,
-                    'reason': f"P-value {coint_result['p_value']:.4f} > {self.pair_config.MAX_COINTEGRATION_PVALUE}"
+                    'reason': reason
                 }
-
-            # Calculate spread and z-score
-            spread = self.calculate_spread(price1, price2, 
-                                         coint_result['hedge_ratio'], 
-                                         coint_result['intercept'])
-            z_score = self.calculate_zscore(spread)
-
-            # Generate trading signals
-            signals = self.generate_trading_signals(z_score, spread)
-
-            # Calculate basic statistics
-            correlation = price1.corr(price2)
-            current_z_score = z_score.iloc[-1] if len(z_score) > 0 else 0
-
-            # Count trading opportunities
-            entry_signals = signals['entry'].sum() if not signals.empty else 0
+                self._analysis_cache[cache_key] = result
+                return result
+
+            # Spread and z-score on the aligned arrays; _align was
+            # already paid for inside test_cointegration. The screening
+            # path runs in float32 — prices carry 4-6 significant
+            # digits and the z threshold is ~2.0, so single precision
+            # halves the memory traffic at no decision cost — while the
+            # full path keeps float64 for the reported signals
+            pair_arrays = self._align(price1, price2)
+            if return_signals:
+                p1, p2 = pair_arrays.p1, pair_arrays.p2
+            else:
+                p1 = pair_arrays.p1.astype(np.float32)
+                p2 = pair_arrays.p2.astype(np.float32)
+            spread_arr = _spread_arr(p1, p2,
+                                     float(coint_result['hedge_ratio']),
+                                     float(coint_result['intercept']))
+            z_arr = self._zscore_arr(spread_arr, self.trading_config.ROLLING_WINDOW)
+
+            # Generate trading signals; the screener only needs the
+            # entry count, so skip the full signals frame (and its
+            # to_dict serialization) when nobody will read it
+            if return_signals:
+                spread = pd.Series(spread_arr, index=pair_arrays.index)
+                z_score = pd.Series(z_arr, index=pair_arrays.index)
+                signals = self.generate_trading_signals(z_score, spread)
+                entry_signals = signals['entry'].sum() if not signals.empty else 0
+                recent_signals = signals.tail(10).to_dict() if not signals.empty else {}
+            else:
+                beyond = np.abs(z_arr) > self.trading_config.Z_SCORE_ENTRY
+                entry_signals = int((beyond[1:] & ~beyond[:-1]).sum())
+                recent_signals = {}
+
+            # Calculate basic statistics; the correlation was already
+            # computed on the aligned arrays inside test_cointegration
+            correlation = coint_result['correlation']
+            current_z_score = float(z_arr[-1]) if z_arr.size > 0 else 0
 
             result = {
                 'pair': f"{symbol1} - {symbol2}",
@@ -316,19 +638,26 @@ class StatisticalArbitrageEngine:
                 'cointegration_details': coint_result,
                 'correlation': correlation,
                 'current_z_score': current_z_score,
-                'spread_mean': spread.mean(),
-                'spread_std': spread.std(),
+                'spread_mean': float(spread_arr.mean()),
+                'spread_std': float(spread_arr.std(ddof=1)),
                 'signals_count': entry_signals,
                 'data_points': len(price1),
                 'last_updated': datetime.now().isoformat(),
-                'signals': signals.tail(10).to_dict() if not signals.empty else {},  # Last 10 signals
+                'signals': recent_signals,  # Last 10 signals
                 'current_signal': self._get_current_signal(current_z_score)
             }
 
+            # Drop stale minute buckets before caching the fresh result
+            bucket = cache_key[-1]
+            if len(self._analysis_cache) > 2 * len(self.pair_config.DEFAULT_PAIRS):
+                self._analysis_cache = {k: v for k, v in self._analysis_cache.items()
+                                        if k[-1] == bucket}
+            self._analysis_cache[cache_key] = result
+
             return result
 
         except Exception as e:
-            self.logger.error(f"Error analyzing pair {symbol1}-{symbol2}: {str(e)}")
+            self.logger.error("Error analyzing pair %s-%s: %s", symbol1, symbol2, str(e))
             return {'error': str(e)}
 
     def _get_current_signal(self, z_score: float) -> dict:
@@ -344,23 +673,27 @@ class StatisticalArbitrageEngine:
         if pd.isna(z_score):
             return {'signal': 'NO_DATA', 'strength': 0, 'description': 'No data available'}
 
-        if z_score > self.trading_config.Z_SCORE_ENTRY:
-            strength = min(abs(z_score) / self.trading_config.Z_SCORE_ENTRY, 3.0)
+        # Hoist the thresholds; this runs per pair per monitoring tick
+        entry_z = self.trading_config.Z_SCORE_ENTRY
+        exit_z = self.trading_config.Z_SCORE_EXIT
+
+        if z_score > entry_z:
+            strength = min(abs(z_score) / entry_z, 3.0)
             return {
                 'signal': 'SHORT_PAIR',
                 'strength': strength,
                 'description': f'Short pair (z-score: {z_score:.2f})',
                 'action': 'Sell stock2, Buy stock1'
             }
-        elif z_score < -self.trading_config.Z_SCORE_ENTRY:
-            strength = min(abs(z_score) / self.trading_config.Z_SCORE_ENTRY, 3.0)
+        elif z_score < -entry_z:
+            strength = min(abs(z_score) / entry_z, 3.0)
             return {
                 'signal': 'LONG_PAIR',
                 'strength': strength,
                 'description': f'Long pair (z-score: {z_score:.2f})',
                 'action': 'Buy stock2, Sell stock1'
             }
-        elif abs(z_score) < self.trading_config.Z_SCORE_EXIT:
+        elif abs(z_score) < exit_z:
             return {
                 'signal': 'CLOSE_POSITION',
                 'strength': 1.0,
@@ -375,36 +708,131 @@ class StatisticalArbitrageEngine:
                 'action': 'No action required'
             }
 
-    def screen_all_pairs(self) -> list:
+    def update_pair(self, pair_key: str, new_price1: float, new_price2: float,
+                    hedge_ratio: float = None, intercept: float = 0.0) -> dict:
         """
-        Screen all default pairs for cointegration
+        O(1) incremental signal update for one live bar
+
+        Live monitoring previously re-ran the full rolling recompute for
+        every tick. This keeps a window of recent spreads plus running
+        sum/sum-of-squares per pair in pairs_data, so each new bar costs
+        a constant amount of work.
+
+        Args:
+            pair_key: Pair identifier (e.g. 'RELIANCE.NS - ONGC.NS')
+            new_price1: Latest price of stock1
+            new_price2: Latest price of stock2
+            hedge_ratio: Hedge ratio from cointegration; required on the
+                         first call for a pair, updates the stored value
+                         (with intercept) when passed again
+            intercept: Intercept from cointegration
+
+        Returns:
+            Dict with the new spread, z-score and current signal
+        """
+        state = self.pairs_data.get(pair_key)
+        if state is None:
+            if hedge_ratio is None:
+                return {'error': f'No state for {pair_key}; pass hedge_ratio on first update'}
+            state = {
+                'hedge_ratio': hedge_ratio,
+                'intercept': intercept,
+                'spreads': deque(maxlen=self.trading_config.ROLLING_WINDOW),
+                'sum': 0.0,
+                'sumsq': 0.0
+            }
+            self.pairs_data[pair_key] = state
+        elif hedge_ratio is not None:
+            # Re-calibration after a fresh cointegration fit
+            state['hedge_ratio'] = hedge_ratio
+            state['intercept'] = intercept
+
+        spread = new_price2 - state['hedge_ratio'] * new_price1 - state['intercept']
+
+        spreads = state['spreads']
+        if len(spreads) == spreads.maxlen:
+            oldest = spreads[0]
+            state['sum'] -= oldest
+            state['sumsq'] -= oldest * oldest
+        spreads.append(spread)
+        state['sum'] += spread
+        state['sumsq'] += spread * spread
+
+        # Same warm-up rule as the batch z-score (min_count=window//2)
+        n = len(spreads)
+        if n < max(2, spreads.maxlen // 2):
+            z_score = float('nan')
+        else:
+            mean = state['sum'] / n
+            variance = (state['sumsq'] - n * mean * mean) / (n - 1)
+            std = variance ** 0.5 if variance > 0 else 0.0
+            z_score = (spread - mean) / std if std > 0 else float('nan')
+
+        return {
+            'pair': pair_key,
+            'spread': spread,
+            'z_score': z_score,
+            'current_signal': self._get_current_signal(z_score)
+        }
+
+    def screen_all_pairs(self, sectors=None) -> list:
+        """
+        Screen default pairs for cointegration
+
+        Args:
+            sectors: Optional sector name (or tuple of names) to restrict
+                     the scan to intra-sector candidates
 
         Returns:
             List of viable pairs with analysis
         """
         viable_pairs = []
+        pairs = candidate_pairs(sectors)
 
         self.logger.info("Screening all default pairs for cointegration...")
 
-        for symbol1, symbol2 in self.pair_config.DEFAULT_PAIRS:
-            try:
-                analysis = self.analyze_pair(symbol1, symbol2)
-
-                if analysis.get('cointegrated', False):
-                    viable_pairs.append(analysis)
-                    self.logger.info(f"✓ Viable pair found: {analysis['pair']} "
-                                   f"(p-value: {analysis['cointegration_details']['p_value']:.4f})")
-                else:
-                    self.logger.info(f"✗ Pair rejected: {symbol1}-{symbol2} "
-                                   f"({'Error' if 'error' in analysis else 'Not cointegrated'})")
+        # One batched download for the whole universe instead of two
+        # HTTP round-trips per pair
+        self._prefetch_universe({s for pair in pairs for s in pair})
 
+        # Each pair is independent once the data is prefetched, so fan
+        # the analysis out over a process pool; workers re-read the
+        # prefetched frames from the daily disk cache
+        results = None
+        max_workers = min(len(pairs), os.cpu_count() or 1)
+        if max_workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(
+                        _analyze_pair_task,
+                        [(symbol1, symbol2, '1y', False) for symbol1, symbol2 in pairs]))
             except Exception as e:
-                self.logger.error(f"Error screening pair {symbol1}-{symbol2}: {str(e)}")
+                self.logger.error("Parallel screening failed, running serially: %s", str(e))
+
+        if results is None:
+            results = []
+            for symbol1, symbol2 in pairs:
+                try:
+                    results.append(self.analyze_pair(symbol1, symbol2,
+                                                     return_signals=False))
+                except Exception as e:
+                    self.logger.error("Error screening pair %s-%s: %s", symbol1, symbol2, str(e))
+                    results.append({'pair': f"{symbol1}-{symbol2}", 'error': str(e)})
+
+        for (symbol1, symbol2), analysis in zip(pairs, results):
+            if analysis.get('cointegrated', False):
+                viable_pairs.append(analysis)
+                self.logger.info("✓ Viable pair found: %s (p-value: %.4f)",
+                                 analysis['pair'],
+                                 analysis['cointegration_details']['p_value'])
+            else:
+                self.logger.info("✗ Pair rejected: %s-%s (%s)", symbol1, symbol2,
+                                 'Error' if 'error' in analysis else 'Not cointegrated')
 
         # Sort by p-value (lower is better)
         viable_pairs.sort(key=lambda x: x.get('cointegration_details', {}).get('p_value', 1.0))
 
-        self.logger.info(f"Found {len(viable_pairs)} viable pairs out of {len(self.pair_config.DEFAULT_PAIRS)}")
+        self.logger.info("Found %d viable pairs out of %d", len(viable_pairs), len(pairs))
 
         return viable_pairs
 
@@ -457,6 +885,53 @@ class StatisticalArbitrageEngine:
             'capital_utilization': (total_cost / available_capital) * 100
         }
 
+    def calculate_position_sizes(self, prices1: np.ndarray, prices2: np.ndarray,
+                                 hedge_ratios: np.ndarray,
+                                 available_capital: float = None) -> dict:
+        """
+        Vectorized position sizing for arrays of quotes
+
+        Same sizing rule as calculate_position_size, applied to whole
+        arrays at once so per-bar backtest loops don't pay Python
+        arithmetic per call.
+
+        Args:
+            prices1: Prices of stock1
+            prices2: Prices of stock2
+            hedge_ratios: Hedge ratio per row
+            available_capital: Available trading capital
+
+        Returns:
+            Dict of int32/float64 arrays mirroring the scalar result
+        """
+        if available_capital is None:
+            available_capital = self.pair_config.CAPITAL_PER_PAIR
+
+        prices1 = np.asarray(prices1, dtype=np.float64)
+        prices2 = np.asarray(prices2, dtype=np.float64)
+        abs_hr = np.abs(np.asarray(hedge_ratios, dtype=np.float64))
+
+        target_exposure = available_capital * self.trading_config.MAX_POSITION_SIZE
+
+        quantity2 = np.floor(target_exposure / (abs_hr * prices1 + prices2)).astype(np.int32)
+        quantity1 = np.floor(abs_hr * quantity2).astype(np.int32)
+        np.maximum(quantity1, 1, out=quantity1)
+        np.maximum(quantity2, 1, out=quantity2)
+
+        cost1 = quantity1 * prices1
+        cost2 = quantity2 * prices2
+        total_cost = cost1 + cost2
+
+        return {
+            'quantity1': quantity1,
+            'quantity2': quantity2,
+            'cost1': cost1,
+            'cost2': cost2,
+            'total_cost': total_cost,
+            'hedge_ratio': hedge_ratios,
+            'capital_utilization': (total_cost / available_capital) * 100
+        }
+
     def validate_trade_profitability(self, symbol1: str, symbol2: str, 
                                    quantity1: int, quantity2: int,
                                    entry_price1: float, entry_price2: float,
@@ -520,9 +995,23 @@ class StatisticalArbitrageEngine:
             }
 
         except Exception as e:
-            self.logger.error(f"Error validating trade profitability: {str(e)}")
+            self.logger.error("Error validating trade profitability: %s", str(e))
             return {'error': str(e)}
 
+# Per-process engine for pool workers; built lazily so nothing
+# unpicklable (logger handlers, caches) crosses the process boundary.
+_WORKER_ENGINE = None
+
+def _analyze_pair_task(args):
+    """Analyze one (symbol1, symbol2, period[, return_signals]) tuple in a worker process"""
+    global _WORKER_ENGINE
+    if _WORKER_ENGINE is None:
+        _WORKER_ENGINE = StatisticalArbitrageEngine()
+    symbol1, symbol2, period = args[:3]
+    return_signals = args[3] if len(args) > 3 else True
+    return _WORKER_ENGINE.analyze_pair(symbol1, symbol2, period,
+                                       return_signals=return_signals)
+
 # Example usage
 if __name__ == "__main__":
     engine = StatisticalArbitrageEngine()